@@ -1,11 +1,17 @@
 """Main application window."""
 from __future__ import annotations
 
+import atexit
+import functools
+import itertools
+import logging
 import os
+import shutil
 import tempfile
-from typing import List, Optional
+import threading
+from typing import Optional, Tuple
 
-from PySide6.QtCore import QObject, QThread, Qt, Slot
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Qt, Signal, Slot
 from PySide6.QtGui import QAction, QDragEnterEvent, QDropEvent, QIcon, QKeySequence
 from PySide6.QtWidgets import (
     QComboBox,
@@ -22,16 +28,86 @@ from PySide6.QtWidgets import (
 )
 
 from app.models.caption import Caption
-from app.utils.srt_utils import parse_srt
+from app.utils import cache_utils, model_registry
+from app.utils.srt_utils import iter_srt
 from app.widgets.caption_table import CaptionTable
 from app.widgets.loading_dialog import LoadingDialog
 from app.widgets.log_viewer import LogViewerDialog
 from app.widgets.video_player import VideoPlayer
-from app.workers.tts_worker import DEFAULT_VOICE
+from app.workers.pool import WorkerRunnable
+from app.workers.tts_worker import DEFAULT_VOICE, group_adjacent_captions
 
 # Resolve logo path relative to this file
 _IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
 
+logger = logging.getLogger(__name__)
+
+# Video formats accepted by drag & drop and the Open dialog (without the dot)
+_VIDEO_EXT_ORDER = ("mp4", "mkv", "avi", "mov", "webm", "flv", "wmv")
+_VIDEO_EXTS = frozenset(_VIDEO_EXT_ORDER)
+_VIDEO_FILE_FILTER = (
+    "Video Files (" + " ".join(f"*.{ext}" for ext in _VIDEO_EXT_ORDER) + ");;All Files (*)"
+)
+_SRT_FILE_FILTER = "SRT Subtitle Files (*.srt);;All Files (*)"
+_MP4_FILE_FILTER = "MP4 Video (*.mp4);;All Files (*)"
+
+
+# Worker classes are imported on first use (keeps start-up light) and then
+# memoised; MainWindow also warms them up on idle right after launch.
+@functools.lru_cache(maxsize=None)
+def _transcribe_cls():
+    from app.workers.transcribe_worker import TranscribeWorker
+    return TranscribeWorker
+
+
+@functools.lru_cache(maxsize=None)
+def _translate_cls():
+    from app.workers.translate_worker import TranslateWorker
+    return TranslateWorker
+
+
+@functools.lru_cache(maxsize=None)
+def _tts_cls():
+    from app.workers.tts_worker import TTSWorker
+    return TTSWorker
+
+
+@functools.lru_cache(maxsize=None)
+def _export_cls():
+    from app.workers.export_worker import ExportWorker
+    return ExportWorker
+
+
+_WORKER_ACCESSORS = (_transcribe_cls, _translate_cls, _tts_cls, _export_cls)
+
+
+class _ThrottledProgress(QObject):
+    """Coalesce worker progress values into at most one update per interval.
+
+    Workers may emit ``progress`` once per caption; repainting two progress
+    bars for each of them keeps the GUI thread busy.  Only the latest value
+    is forwarded, at most every *interval_ms* milliseconds (~30 Hz).
+    """
+
+    value_changed = Signal(int)
+
+    def __init__(self, parent: QObject | None = None, interval_ms: int = 33) -> None:
+        super().__init__(parent)
+        self._pending = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._flush)
+
+    @Slot(int)
+    def set(self, value: int) -> None:
+        self._pending = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self) -> None:
+        self.value_changed.emit(self._pending)
+
 
 class MainWindow(QMainWindow):
     """Top-level window for the Khmer AI Video Dubber."""
@@ -48,23 +124,39 @@ class MainWindow(QMainWindow):
             self.setWindowIcon(QIcon(logo_path))
 
         self._video_path: Optional[str] = None
+        self._video_key: Optional[str] = None   # content hash for the result cache
         self._tts_dir: Optional[str] = None     # temp dir for TTS audio files
+        self._transcribe_cache_key: Optional[str] = None
+        self._translate_cache_key: Optional[str] = None
+        # 16 kHz mono float32 samples of the loaded video, decoded in the
+        # background by AudioDecodeWorker and shared with TranscribeWorker.
+        self._audio_np = None
         self._busy = False
         self._was_cancelled = False
         self._pipeline_running = False  # True while "Run All" chain is active
         self._translate_skipped = 0
 
-        # Active QThread/worker references (prevent GC)
-        self._thread: Optional[QThread] = None
+        # Worker of the current job (target of the Cancel button)
         self._worker: Optional[QObject] = None
 
+        # Every background job runs on the shared pool, which reuses its threads
+        self._pool = QThreadPool.globalInstance()
+        self._pool.setMaxThreadCount(os.cpu_count() or 4)
+
         self.setAcceptDrops(True)
         self._log_viewer: LogViewerDialog | None = None
         self._build_ui()
+        # One loading dialog, re-titled and re-bound for every background job
+        self._loading_dlg = LoadingDialog(self)
+        self._loading_dlg.cancel_requested.connect(self._on_cancel_clicked)
         self._setup_menu()
         self._setup_statusbar()
         self._update_button_states()
 
+        # Import the worker modules once the event loop is idle
+        for accessor in _WORKER_ACCESSORS:
+            QTimer.singleShot(0, accessor)
+
     # ------------------------------------------------------------------ build
     def _build_ui(self) -> None:
         # ---- Toolbar ----
@@ -99,16 +191,18 @@ class MainWindow(QMainWindow):
         self.lang_combo.setCurrentIndex(0)
         lang_label = QLabel("  Language: ")
 
-        # Whisper model selector
+        # Whisper model selector — item data is (model name, batch size).
+        # Smaller models decode more VAD chunks per batch; the large ones are
+        # kept at 4 so a batch still fits in VRAM alongside the weights.
         WHISPER_MODELS = [
-            ("tiny   (fastest)",  "tiny"),
-            ("base",              "base"),
-            ("small",             "small"),
-            ("medium",            "medium"),
-            ("large",             "large"),
-            ("large-v2",          "large-v2"),
-            ("large-v3 (best)",   "large-v3"),
-            ("auto (GPU→medium, CPU→small)", "auto"),
+            ("tiny   (fastest)",  ("tiny",     16)),
+            ("base",              ("base",     16)),
+            ("small",             ("small",     8)),
+            ("medium",            ("medium",    4)),
+            ("large",             ("large",     4)),
+            ("large-v2",          ("large-v2",  4)),
+            ("large-v3 (best)",   ("large-v3",  4)),
+            ("auto (GPU→medium, CPU→small)", ("auto", 8)),
         ]
         self.model_combo = QComboBox()
         self.model_combo.setFixedHeight(32)
@@ -214,6 +308,10 @@ class MainWindow(QMainWindow):
         logs_act.triggered.connect(self._on_view_logs)
         help_menu.addAction(logs_act)
 
+        clear_cache_act = QAction("&Clear Cache", self)
+        clear_cache_act.triggered.connect(self._on_clear_cache)
+        help_menu.addAction(clear_cache_act)
+
     def _on_view_logs(self) -> None:
         if self._log_viewer is None:
             self._log_viewer = LogViewerDialog(self)
@@ -221,6 +319,10 @@ class MainWindow(QMainWindow):
         self._log_viewer.raise_()
         self._log_viewer.activateWindow()
 
+    def _on_clear_cache(self) -> None:
+        cache_utils.clear_cache()
+        self._set_status("Transcription / translation cache cleared.")
+
     def _setup_statusbar(self) -> None:
         self.status_label = QLabel("Ready — drop a video file or click Load Video.")
         self.progress_bar = QProgressBar()
@@ -234,16 +336,13 @@ class MainWindow(QMainWindow):
 
     # ------------------------------------------------------------------ drag & drop
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
-        if event.mimeData().hasUrls():
-            urls  = event.mimeData().urls()
-            exts  = {".mp4", ".mkv", ".avi", ".mov", ".webm", ".flv", ".wmv"}
-            valid = any(
-                os.path.splitext(u.toLocalFile())[1].lower() in exts
-                for u in urls
-            )
-            if valid:
-                event.acceptProposedAction()
-                return
+        mime = event.mimeData()
+        if mime.hasUrls() and any(
+            u.toLocalFile().rpartition(".")[2].lower() in _VIDEO_EXTS
+            for u in mime.urls()
+        ):
+            event.acceptProposedAction()
+            return
         event.ignore()
 
     def dropEvent(self, event: QDropEvent) -> None:
@@ -259,11 +358,33 @@ class MainWindow(QMainWindow):
             return
         self._video_path = path
         self._tts_dir    = tempfile.mkdtemp(prefix="kh_tts_")
+        try:
+            self._video_key = cache_utils.file_key(path)
+        except OSError:
+            self._video_key = None
         self.caption_table.clear()
         self.video_player.load(path)
+        self._start_audio_decode(path)
         self._set_status(f"Loaded: {os.path.basename(path)}")
         self._update_button_states()
 
+    def _start_audio_decode(self, path: str) -> None:
+        """Decode the audio track to 16 kHz mono in the background."""
+        from app.workers.audio_worker import AudioDecodeWorker
+
+        self._audio_np = None   # release the previous video's buffer
+        worker = AudioDecodeWorker(path)
+        worker.audio_ready.connect(self._on_audio_ready)
+        # The runnable holds the only reference until run() returns; this is
+        # not the cancellable "current job", so _start_worker is not used.
+        self._pool.start(WorkerRunnable(worker))
+
+    @Slot(str, object)
+    def _on_audio_ready(self, path: str, audio) -> None:
+        # Ignore results for a video that has since been replaced
+        if path == self._video_path:
+            self._audio_np = audio
+
     def _set_status(self, msg: str) -> None:
         self.status_label.setText(msg)
 
@@ -322,28 +443,39 @@ class MainWindow(QMainWindow):
         self.cancel_btn.setText("\U0001f6ab  Cancel")
         self._set_busy(False, "Cancelled." if was_cancelled else success_msg)
 
-    def _start_worker(self, worker: QObject, thread: QThread) -> None:
-        """Wire up and start a worker/thread pair."""
+    def _connect_progress(self, worker: QObject) -> None:
+        """Route worker.progress through a throttle to both progress bars."""
+        # One throttle per job, so a pending tick can never leak into the next job
+        throttle = _ThrottledProgress(self)
+        worker.progress.connect(throttle.set)
+        worker.finished.connect(throttle.deleteLater)
+        throttle.value_changed.connect(self._loading_dlg.set_progress)
+        throttle.value_changed.connect(self.progress_bar.setValue)
+
+    def _start_worker(self, worker: QObject) -> None:
+        """Run *worker* on the shared thread pool."""
+        # The reference keeps the worker (and its signals) alive until the
+        # next job replaces it; the runnable is deleted by the pool.
         self._worker = worker
-        self._thread = thread
-
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
+        self._pool.start(WorkerRunnable(worker))
 
-        # Generic cleanup
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
+    def _run_job(self, worker: QObject, title: str, message: str, on_finished) -> None:
+        """Show the loading dialog for *worker*, wire the common signals and start it.
 
-        thread.start()
+        Job-specific signals must be connected by the caller beforehand.
+        """
+        self._loading_dlg.reset(title, message)
+        self._loading_dlg.bind(worker)
+        self._connect_progress(worker)
+        worker.error.connect(self._on_worker_error)
+        worker.finished.connect(on_finished)
+        self._start_worker(worker)
+        self._loading_dlg.show()
 
     # ------------------------------------------------------------------ button handlers
     @Slot()
     def _on_load_clicked(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Open Video", "",
-            "Video Files (*.mp4 *.mkv *.avi *.mov *.webm *.flv *.wmv);;All Files (*)"
-        )
+        path, _ = QFileDialog.getOpenFileName(self, "Open Video", "", _VIDEO_FILE_FILTER)
         if path:
             self._load_video(path)
 
@@ -391,7 +523,7 @@ class MainWindow(QMainWindow):
             return
 
         # 4. Start batch worker
-        model_name = self.model_combo.currentData() or "auto"
+        model_name, batch_size = self.model_combo.currentData() or ("auto", 8)
         language   = self.lang_combo.currentData() or "zh"
 
         self._set_busy(True, f"Batch: 0 / {len(video_paths)} — Loading model…")
@@ -401,20 +533,16 @@ class MainWindow(QMainWindow):
             output_dir=output_dir,
             model_name=model_name,
             language=language,
+            batch_size=batch_size,
         )
-        thread = QThread(self)
-
         total_count = len(video_paths)
-        self._loading_dlg = LoadingDialog(
-            self,
-            title="Batch Processing",
-            message=(
-                f"Processing {total_count} video(s)…\n"
-                f"Model: {model_name}   Language: {self.lang_combo.currentText()}\n"
-                "This may take a very long time."
-            ),
+        self._loading_dlg.reset(
+            "Batch Processing",
+            f"Processing {total_count} video(s)…\n"
+            f"Model: {model_name}   Language: {self.lang_combo.currentText()}\n"
+            "This may take a very long time.",
         )
-        self._loading_dlg.cancel_requested.connect(self._on_cancel_clicked)
+        self._loading_dlg.bind(worker)
 
         worker.video_started.connect(self._on_batch_video_started)
         worker.video_step.connect(self._on_batch_video_step)
@@ -423,16 +551,8 @@ class MainWindow(QMainWindow):
         worker.video_done.connect(self._on_batch_video_done)
         worker.video_failed.connect(self._on_batch_video_failed)
         worker.batch_done.connect(self._on_batch_done)
-        worker.finished.connect(self._loading_dlg.close)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
 
-        self._worker = worker
-        self._thread = thread
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
-        thread.start()
+        self._start_worker(worker)
 
         self._loading_dlg.show()
 
@@ -486,28 +606,35 @@ class MainWindow(QMainWindow):
             self._show_error("Please load a video first before importing an SRT file.")
             return
         path, _ = QFileDialog.getOpenFileName(
-            self, "Import SRT File", "",
-            "SRT Subtitle Files (*.srt);;All Files (*)"
+            self, "Import SRT File", "", _SRT_FILE_FILTER
         )
         if not path:
             return
         try:
             import logging as _log
             logger = _log.getLogger(__name__)
-            raw_captions = parse_srt(path)
-            if not raw_captions:
+            raw_captions = iter_srt(path)
+            first = next(raw_captions, None)
+            if first is None:
                 self._show_error("No captions found in the selected SRT file.")
                 return
-            # The exported SRT stores Khmer text; treat the parsed text as khmer_text
-            # so TTS and export work without needing to re-translate.
-            for cap in raw_captions:
-                cap.khmer_text = cap.original_text
-            self.caption_table.load_captions(raw_captions)
+
+            def _as_khmer(caps):
+                # The exported SRT stores Khmer text; treat the parsed text as
+                # khmer_text so TTS and export work without re-translating.
+                for cap in caps:
+                    cap.khmer_text = cap.original_text
+                    yield cap
+
+            # The parser generator is drained straight into a single model
+            # reset — no intermediate list of raw captions is built first
+            self.caption_table.load_captions(_as_khmer(itertools.chain([first], raw_captions)))
+            count = self.caption_table.model.rowCount()
             self._set_status(
-                f"Imported {len(raw_captions)} caption(s) from "
+                f"Imported {count} caption(s) from "
                 f"{os.path.basename(path)} — ready for TTS / Export."
             )
-            logger.info("Imported SRT: %s  (%d captions)", path, len(raw_captions))
+            logger.info("Imported SRT: %s  (%d captions)", path, count)
             self._update_button_states()
         except Exception as exc:
             self._show_error(f"Failed to import SRT:\n{exc}")
@@ -527,36 +654,54 @@ class MainWindow(QMainWindow):
         if not self._video_path:
             return
 
-        from app.workers.transcribe_worker import TranscribeWorker
+        TranscribeWorker = _transcribe_cls()
 
-        model_name = self.model_combo.currentData() or "auto"
+        model_name, batch_size = self.model_combo.currentData() or ("auto", 8)
         language   = self.lang_combo.currentData() or "zh"
         lang_label = self.lang_combo.currentText()
-        self._set_busy(True, f"Transcribing audio with Whisper [{model_name}]  (this may take a while)…")
 
-        worker = TranscribeWorker(self._video_path, model_name=model_name, language=language)
-        thread = QThread(self)
+        self._transcribe_cache_key = (
+            f"{self._video_key}-{model_name}-{language}" if self._video_key else None
+        )
+        if self._transcribe_cache_key:
+            cached = cache_utils.load_captions(self._transcribe_cache_key)
+            if cached:
+                logger.info("Transcription cache hit (%s) — %d captions",
+                            self._transcribe_cache_key, len(cached))
+                self._transcribe_cache_key = None   # nothing new to store
+                self._on_captions_ready(tuple(cached))
+                return
+
+        self._set_busy(True, f"Transcribing audio with Whisper [{model_name}]  (this may take a while)…")
 
-        # Loading popup
-        self._loading_dlg = LoadingDialog(
-            self,
-            title="Whisper Transcription",
-            message=f"Transcribing audio with Whisper…\nModel: {model_name}\nLanguage: {lang_label}\nThis may take a while.",
+        # "auto" lets load_model pick int8_float16 on CUDA and int8 on CPU, matching
+        # the "auto (GPU→medium, CPU→small)" model entry.
+        worker = TranscribeWorker(
+            self._video_path,
+            audio=self._audio_np,   # None if the background decode is not done yet
+            model_name=model_name,
+            language=language,
+            compute_type="auto",
+            batch_size=batch_size,
         )
-        worker.progress.connect(self._loading_dlg.set_progress)
-        worker.finished.connect(self._loading_dlg.close)
-        self._loading_dlg.cancel_requested.connect(self._on_cancel_clicked)
 
-        worker.progress.connect(self.progress_bar.setValue)
-        worker.captions_ready.connect(self._on_captions_ready)
-        worker.error.connect(self._on_worker_error)
-        worker.finished.connect(self._on_worker_finished)
+        # Captions stream into the table while the worker is still decoding
+        self.caption_table.clear()
 
-        self._start_worker(worker, thread)
-        self._loading_dlg.show()
+        worker.caption_partial.connect(self.caption_table.append_captions)
+        worker.captions_ready.connect(self._on_captions_ready)
+        self._run_job(
+            worker,
+            "Whisper Transcription",
+            f"Transcribing audio with Whisper…\nModel: {model_name}\nLanguage: {lang_label}\nThis may take a while.",
+            self._on_worker_finished,
+        )
 
-    @Slot(list)
-    def _on_captions_ready(self, captions: List[Caption]) -> None:
+    @Slot(object)
+    def _on_captions_ready(self, captions: Tuple[Caption, ...]) -> None:
+        if self._transcribe_cache_key:
+            cache_utils.save_captions(self._transcribe_cache_key, captions)
+            self._transcribe_cache_key = None
         self.caption_table.load_captions(captions)
         self._set_status(f"Transcription complete — {len(captions)} segments.")
         self._update_button_states()
@@ -576,6 +721,12 @@ class MainWindow(QMainWindow):
         self.cancel_btn.setText("\U0001f6ab  Cancel")
         skipped = self._translate_skipped
         self._translate_skipped = 0
+        # Only complete translations are cached; partial ones are re-run next time
+        if self._translate_cache_key and not was_cancelled and not skipped:
+            texts = [cap.khmer_text for cap in self.caption_table.get_captions()]
+            if all(texts):
+                cache_utils.save_translations(self._translate_cache_key, texts)
+        self._translate_cache_key = None
         if was_cancelled:
             self._pipeline_running = False
             self._set_busy(False, "Cancelled.")
@@ -599,32 +750,41 @@ class MainWindow(QMainWindow):
         if not captions:
             return
 
-        from app.workers.translate_worker import TranslateWorker
-
-        self._set_busy(True, "Translating captions to Khmer…")
+        # Transcription is done — give the Whisper model's (V)RAM back
+        model_registry.release("whisper")
 
-        worker = TranslateWorker(captions)
-        thread = QThread(self)
+        TranslateWorker = _translate_cls()
+        source_language = self.lang_combo.currentData() or "zh"
 
         self._translate_skipped = 0
-
-        self._loading_dlg = LoadingDialog(
-            self,
-            title="Translate to Khmer",
-            message=f"Translating {len(captions)} captions to Khmer…\nThis may take a while.",
+        # Keyed by backend too: googletrans and NLLB (per source language and
+        # model) give different translations of the same text
+        backend = TranslateWorker.backend_for(source_language)
+        self._translate_cache_key = cache_utils.texts_key(
+            itertools.chain((backend,), (cap.original_text for cap in captions))
         )
-        worker.progress.connect(self._loading_dlg.set_progress)
-        worker.finished.connect(self._loading_dlg.close)
-        self._loading_dlg.cancel_requested.connect(self._on_cancel_clicked)
+        cached = cache_utils.load_translations(self._translate_cache_key)
+        if cached and len(cached) == len(captions):
+            logger.info("Translation cache hit (%s) — %d captions",
+                        self._translate_cache_key, len(cached))
+            self._translate_cache_key = None   # nothing new to store
+            for cap, text in zip(captions, cached):
+                self.caption_table.update_khmer_text(cap.index, text)
+            self._on_translate_finished()
+            return
+
+        self._set_busy(True, "Translating captions to Khmer…")
+
+        worker = TranslateWorker(captions, source_language=source_language)
 
-        worker.progress.connect(self.progress_bar.setValue)
         worker.caption_translated.connect(self.caption_table.update_khmer_text)
         worker.caption_skipped.connect(self._on_caption_skipped)
-        worker.error.connect(self._on_worker_error)
-        worker.finished.connect(self._on_translate_finished)
-
-        self._start_worker(worker, thread)
-        self._loading_dlg.show()
+        self._run_job(
+            worker,
+            "Translate to Khmer",
+            f"Translating {len(captions)} captions to Khmer…\nThis may take a while.",
+            self._on_translate_finished,
+        )
 
     @Slot()
     def _on_tts_clicked(self) -> None:
@@ -634,29 +794,21 @@ class MainWindow(QMainWindow):
 
         voice = DEFAULT_VOICE
 
-        from app.workers.tts_worker import TTSWorker
+        TTSWorker = _tts_cls()
 
         self._set_busy(True, "Generating Khmer TTS audio…")
 
-        worker = TTSWorker(captions, self._tts_dir, voice=voice)
-        thread = QThread(self)
+        # Adjacent same-voice captions share one Edge TTS request
+        groups = group_adjacent_captions(captions, voice)
+        worker = TTSWorker(captions, self._tts_dir, voice=voice, groups=groups)
 
-        self._loading_dlg = LoadingDialog(
-            self,
-            title="Generate TTS",
-            message=f"Generating TTS audio for {len(captions)} captions…\nThis may take a while.",
-        )
-        worker.progress.connect(self._loading_dlg.set_progress)
-        worker.finished.connect(self._loading_dlg.close)
-        self._loading_dlg.cancel_requested.connect(self._on_cancel_clicked)
-
-        worker.progress.connect(self.progress_bar.setValue)
         worker.caption_audio_ready.connect(self.caption_table.update_tts_path)
-        worker.error.connect(self._on_worker_error)
-        worker.finished.connect(self._on_tts_finished)
-
-        self._start_worker(worker, thread)
-        self._loading_dlg.show()
+        self._run_job(
+            worker,
+            "Generate TTS",
+            f"Generating TTS audio for {len(captions)} captions…\nThis may take a while.",
+            self._on_tts_finished,
+        )
 
     @Slot()
     def _on_export_clicked(self) -> None:
@@ -668,13 +820,12 @@ class MainWindow(QMainWindow):
             return
 
         out_path, _ = QFileDialog.getSaveFileName(
-            self, "Export Video", "output_dubbed.mp4",
-            "MP4 Video (*.mp4);;All Files (*)"
+            self, "Export Video", "output_dubbed.mp4", _MP4_FILE_FILTER
         )
         if not out_path:
             return
 
-        from app.workers.export_worker import ExportWorker
+        ExportWorker = _export_cls()
 
         self._set_busy(True, "Exporting video with dubbed audio…")
 
@@ -685,25 +836,14 @@ class MainWindow(QMainWindow):
             original_volume=1.0,
             mute_during_captions=True,
         )
-        thread = QThread(self)
-
-        # Loading popup
-        self._loading_dlg = LoadingDialog(
-            self,
-            title="Exporting Video",
-            message="Exporting video with dubbed audio…\nThis may take a while.",
-        )
-        worker.progress.connect(self._loading_dlg.set_progress)
-        worker.finished.connect(self._loading_dlg.close)
-        self._loading_dlg.cancel_requested.connect(self._on_cancel_clicked)
 
-        worker.progress.connect(self.progress_bar.setValue)
         worker.done.connect(self._on_export_finished)
-        worker.error.connect(self._on_worker_error)
-        worker.finished.connect(self._on_worker_finished)
-
-        self._start_worker(worker, thread)
-        self._loading_dlg.show()
+        self._run_job(
+            worker,
+            "Exporting Video",
+            "Exporting video with dubbed audio…\nThis may take a while.",
+            self._on_worker_finished,
+        )
 
     @Slot(str)
     def _on_export_finished(self, output_path: str) -> None:
@@ -729,10 +869,15 @@ class MainWindow(QMainWindow):
 
     # ------------------------------------------------------------------ close
     def closeEvent(self, event) -> None:
+        self._audio_np = None
+        model_registry.release()
         if self._tts_dir and os.path.isdir(self._tts_dir):
-            import shutil
-            try:
-                shutil.rmtree(self._tts_dir, ignore_errors=True)
-            except Exception:
-                pass
+            # Deleting hundreds of clips can take seconds — don't hold the
+            # window open for it, but let it finish before the process exits.
+            cleanup = threading.Thread(
+                target=shutil.rmtree, args=(self._tts_dir,),
+                kwargs={"ignore_errors": True}, name="tts-cleanup", daemon=True,
+            )
+            cleanup.start()
+            atexit.register(cleanup.join, 5.0)
         event.accept()
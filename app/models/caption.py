@@ -1,8 +1,12 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
+# __slots__ via dataclass needs Python 3.10+; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Caption:
     """Represents a single subtitle/caption segment."""
 
@@ -0,0 +1,171 @@
+"""On-disk result cache for transcription, translation and TTS audio.
+
+Results are stored under ``~/.cache/khmer-dubber/<namespace>/`` (JSON, or
+the audio file itself for TTS), keyed by a content hash so re-opening the
+same video (or re-translating / re-voicing the same captions) skips the
+expensive step entirely.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import fields
+from typing import Dict, Iterable, List, Optional
+
+from app.models.caption import Caption
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "khmer-dubber")
+
+# Only the head of the file is hashed — enough to tell videos apart without
+# reading multi-GB files on the UI thread.
+_HEAD_BYTES = 1024 * 1024
+
+
+# --------------------------------------------------------------------------- #
+#  Keys
+# --------------------------------------------------------------------------- #
+
+def file_key(path: str) -> str:
+    """Return a content key for a media file (size + first 1 MiB)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(os.path.getsize(path)).encode())
+    with open(path, "rb") as fh:
+        h.update(fh.read(_HEAD_BYTES))
+    return h.hexdigest()
+
+
+def texts_key(texts: Iterable[str]) -> str:
+    """Return a content key for an ordered sequence of strings."""
+    h = hashlib.blake2b(digest_size=16)
+    for text in texts:
+        h.update(text.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def tts_key(text: str, voice: str) -> str:
+    """Return a content key for the TTS audio of *text* spoken by *voice*."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(voice.encode("utf-8"))
+    h.update(b"\0")
+    h.update(text.encode("utf-8"))
+    return h.hexdigest()
+
+
+# --------------------------------------------------------------------------- #
+#  Raw JSON storage
+# --------------------------------------------------------------------------- #
+
+def _entry_path(namespace: str, key: str) -> str:
+    return os.path.join(CACHE_DIR, namespace, f"{key}.json")
+
+
+def _load_json(namespace: str, key: str):
+    try:
+        with open(_entry_path(namespace, key), "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        log.warning("[cache] could not read %s/%s: %s", namespace, key, exc)
+        return None
+
+
+def _save_json(namespace: str, key: str, data) -> None:
+    folder = os.path.join(CACHE_DIR, namespace)
+    try:
+        os.makedirs(folder, exist_ok=True)
+        # Write to a temp file first so a crash never leaves a torn entry
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, ensure_ascii=False)
+        os.replace(tmp_path, _entry_path(namespace, key))
+    except OSError as exc:
+        log.warning("[cache] could not write %s/%s: %s", namespace, key, exc)
+
+
+# --------------------------------------------------------------------------- #
+#  Public API
+# --------------------------------------------------------------------------- #
+
+def load_captions(key: str) -> Optional[List[Caption]]:
+    """Return cached transcription captions for *key*, or None on a miss."""
+    data = _load_json("transcribe", key)
+    if data is None:
+        return None
+    try:
+        return [Caption(**item) for item in data]
+    except TypeError as exc:
+        log.warning("[cache] stale transcription entry %s: %s", key, exc)
+        return None
+
+
+def save_captions(key: str, captions: List[Caption]) -> None:
+    """Store transcription captions under *key*."""
+    names = [f.name for f in fields(Caption) if f.init]
+    _save_json(
+        "transcribe", key,
+        [{name: getattr(cap, name) for name in names} for cap in captions],
+    )
+
+
+def load_translations(key: str) -> Optional[List[str]]:
+    """Return cached Khmer texts for *key*, or None on a miss."""
+    return _load_json("translate", key)
+
+
+def save_translations(key: str, texts: List[str]) -> None:
+    """Store Khmer texts (aligned with the source captions) under *key*."""
+    _save_json("translate", key, list(texts))
+
+
+def load_phrase_translations(target_language: str) -> Dict[str, str]:
+    """Return the cached source text → translation map for *target_language*."""
+    data = _load_json("translate", f"phrases-{target_language}")
+    return data if isinstance(data, dict) else {}
+
+
+def save_phrase_translations(target_language: str, phrases: Dict[str, str]) -> None:
+    """Store the source text → translation map for *target_language*."""
+    _save_json("translate", f"phrases-{target_language}", phrases)
+
+
+def _tts_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, "tts", f"{key}.mp3")
+
+
+def load_tts_audio(key: str, dest_path: str) -> bool:
+    """Copy the cached TTS audio for *key* to *dest_path*; False on a miss."""
+    try:
+        shutil.copyfile(_tts_path(key), dest_path)
+        return True
+    except FileNotFoundError:
+        return False
+    except OSError as exc:
+        log.warning("[cache] could not read tts/%s: %s", key, exc)
+        return False
+
+
+def save_tts_audio(key: str, src_path: str) -> None:
+    """Store a copy of the TTS audio file *src_path* under *key*."""
+    folder = os.path.join(CACHE_DIR, "tts")
+    try:
+        os.makedirs(folder, exist_ok=True)
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        os.close(tmp_fd)
+        shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, _tts_path(key))
+    except OSError as exc:
+        log.warning("[cache] could not write tts/%s: %s", key, exc)
+
+
+def clear_cache() -> None:
+    """Delete every cached result."""
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    log.info("[cache] cleared %s", CACHE_DIR)
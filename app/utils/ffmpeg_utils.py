@@ -1,33 +1,55 @@
 """FFmpeg-based audio mixing and export helpers."""
 from __future__ import annotations
 
+import collections
+import ctypes
+import functools
 import logging
 import os
 import re
 import subprocess
+import struct
+import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import ffmpeg
+import numpy as np
 
 from app.models.caption import Caption
 
 log = logging.getLogger(__name__)
 
+# Key of the encoded position (microseconds) in ``-progress`` output
+_PROGRESS_TIME_KEY = b"out_time_us="
+
 
 # --------------------------------------------------------------------------- #
 #  Probe helpers
 # --------------------------------------------------------------------------- #
 
+@functools.lru_cache(maxsize=32)
+def _probe_cached(path: str, mtime: float, size: int) -> dict:
+    return ffmpeg.probe(path)
+
+
+def _probe(path: str) -> dict:
+    """``ffmpeg.probe`` memoised per (path, mtime, size) — a changed file is re-probed."""
+    st = os.stat(path)
+    return _probe_cached(path, st.st_mtime, st.st_size)
+
+
 def get_video_duration(video_path: str) -> float:
     """Return duration of a media file in seconds."""
-    info = ffmpeg.probe(video_path)
+    info = _probe(video_path)
     return float(info["format"].get("duration", 0))
 
 
 def get_video_info(video_path: str) -> dict:
     """Return basic metadata dict: duration, width, height, fps."""
-    info  = ffmpeg.probe(video_path)
+    info  = _probe(video_path)
     vstream = next(
         (s for s in info["streams"] if s["codec_type"] == "video"), {}
     )
@@ -57,6 +79,8 @@ _WIN_CMDLINE_THRESHOLD = 8_000
 def _run_ffmpeg_node_async(
     node,
     pipe_stderr: bool = True,
+    pipe_stdout: bool = False,
+    pipe_stdin: bool = False,
 ) -> tuple["subprocess.Popen", "str | None"]:
     """
     Compile an ffmpeg-python node and launch it as an async subprocess.
@@ -106,25 +130,82 @@ def _run_ffmpeg_node_async(
     kwargs: dict = {}
     if pipe_stderr:
         kwargs["stderr"] = subprocess.PIPE
+    if pipe_stdout:
+        kwargs["stdout"] = subprocess.PIPE
+    if pipe_stdin:
+        kwargs["stdin"] = subprocess.PIPE
     process = subprocess.Popen(cmd, **kwargs)
     return process, tmp_script
 
 
+def _drain_stderr(process: "subprocess.Popen", tail: collections.deque, label: str) -> threading.Thread:
+    """
+    Drain *process*'s stderr on a dedicated reader thread.
+
+    The reader keeps ffmpeg's pipe empty while the caller is busy with the
+    progress stream, so ffmpeg never blocks on a full pipe.  The last lines
+    are kept in *tail* for error messages.
+    """
+    def _pump() -> None:
+        debug = log.isEnabledFor(logging.DEBUG)
+        for line in process.stderr:
+            line = line.rstrip()
+            if line:
+                tail.append(line)
+                if debug:
+                    log.debug("[ffmpeg %s] %s", label, line.decode("utf-8", errors="ignore"))
+
+    thread = threading.Thread(target=_pump, name="ffmpeg-stderr", daemon=True)
+    thread.start()
+    return thread
+
+
 # --------------------------------------------------------------------------- #
 #  GPU / codec detection
 # --------------------------------------------------------------------------- #
 
+def _nvidia_driver_present() -> bool:
+    """
+    In-process NVML check: is an NVIDIA driver loaded with at least one GPU?
+
+    ``dlopen`` + ``nvmlInit`` takes about a millisecond, so machines without
+    an NVIDIA GPU never pay for the ffmpeg subprocess probes below.
+    """
+    if sys.platform == "darwin":
+        return False
+    lib_name = "nvml.dll" if sys.platform == "win32" else "libnvidia-ml.so.1"
+    try:
+        nvml = ctypes.CDLL(lib_name)
+    except OSError:
+        log.debug("[nvenc-detect] %s not found — no NVIDIA driver", lib_name)
+        return False
+    try:
+        if nvml.nvmlInit_v2() != 0:
+            return False
+        count = ctypes.c_uint(0)
+        ok = nvml.nvmlDeviceGetCount_v2(ctypes.byref(count)) == 0 and count.value > 0
+        nvml.nvmlShutdown()
+        return ok
+    except AttributeError as exc:
+        log.debug("[nvenc-detect] unexpected NVML library: %s", exc)
+        return False
+
+
 def _detect_nvenc() -> bool:
     """
     Return True only when the installed ffmpeg can actually encode with h264_nvenc.
 
-    Two-stage check:
+    Three-stage check:
+      0. NVML probe      → is there an NVIDIA GPU/driver at all? (in-process)
       1. Encoder list    → does the ffmpeg build include h264_nvenc?
       2. Live smoke-test → can the GPU actually initialise the encoder?
     Stage 2 catches cases where the build has NVENC support but the driver /
     GPU is absent or misconfigured (the encoder appears in the list but fails
     at runtime, which would cause the export to error out).
     """
+    if not _nvidia_driver_present():
+        return False
+
     try:
         result = subprocess.run(
             ["ffmpeg", "-hide_banner", "-encoders"],
@@ -161,39 +242,110 @@ def _detect_nvenc() -> bool:
         return False
 
 
-# Cache the result so we only probe once per process lifetime.
+# Quality knobs layered on top of preset p4 / VBR cq 23: lookahead, adaptive
+# quantisation and B-frames as references.  ``bf`` is a generic codec option;
+# the rest are h264_nvenc private options and depend on ffmpeg/GPU support.
+_NVENC_TUNING: dict = {
+    "tune":         "hq",
+    "rc-lookahead": 20,
+    "spatial-aq":   1,
+    "temporal-aq":  1,
+    "b_ref_mode":   "middle",
+    "bf":           3,
+}
+_NVENC_OPTION_RE = re.compile(r"^\s+-([\w-]+)\s", re.MULTILINE)
+
+
+def _detect_nvenc_tuning() -> dict:
+    """
+    Return the subset of ``_NVENC_TUNING`` this ffmpeg build and GPU accept.
+
+    Private options are checked against ``ffmpeg -h encoder=h264_nvenc``; the
+    survivors are then smoke-tested together, and dropped entirely if the GPU
+    rejects them (e.g. B-frame references on pre-Turing cards).
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-h", "encoder=h264_nvenc"],
+            capture_output=True, text=True, timeout=10,
+        )
+    except Exception as exc:
+        log.warning("[nvenc-detect] encoder-help probe failed: %s", exc)
+        return {}
+    supported = set(_NVENC_OPTION_RE.findall(result.stdout + result.stderr))
+    tuning = {
+        k: v for k, v in _NVENC_TUNING.items() if k == "bf" or k in supported
+    }
+    skipped = sorted(set(_NVENC_TUNING) - set(tuning))
+    if skipped:
+        log.debug("[nvenc-detect] unsupported tuning options skipped: %s", skipped)
+
+    args: list[str] = []
+    for k, v in tuning.items():
+        args.extend([f"-{k}", str(v)])
+    try:
+        test = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "nullsrc=s=128x128:d=1",
+                "-vcodec", "h264_nvenc", "-preset", "p4", *args, "-f", "null", "-",
+            ],
+            capture_output=True, timeout=15,
+        )
+    except Exception as exc:
+        log.warning("[nvenc-detect] tuning smoke-test failed: %s", exc)
+        return {}
+    if test.returncode != 0:
+        log.info(
+            "[nvenc-detect] NVENC tuning rejected — using plain p4 settings.\n%s",
+            test.stderr.decode("utf-8", errors="ignore")[-400:],
+        )
+        return {}
+    return tuning
+
+
+# Cache the results so we only probe once per process lifetime.
 _NVENC_AVAILABLE: bool | None = None
+_NVENC_TUNING_KWARGS: dict = {}
+_NVENC_LOCK = threading.Lock()
 
 
 def _nvenc_available() -> bool:
-    global _NVENC_AVAILABLE
+    global _NVENC_AVAILABLE, _NVENC_TUNING_KWARGS
+    with _NVENC_LOCK:
+        if _NVENC_AVAILABLE is None:
+            _NVENC_AVAILABLE = _detect_nvenc()
+            if _NVENC_AVAILABLE:
+                _NVENC_TUNING_KWARGS = _detect_nvenc_tuning()
+        return _NVENC_AVAILABLE
+
+
+def prefetch_nvenc_detection() -> None:
+    """Run the NVENC probe on a daemon thread so the first export finds it cached."""
     if _NVENC_AVAILABLE is None:
-        _NVENC_AVAILABLE = _detect_nvenc()
-    return _NVENC_AVAILABLE
+        threading.Thread(
+            target=_nvenc_available, name="nvenc-detect", daemon=True,
+        ).start()
+
+
+prefetch_nvenc_detection()
 
 
 # --------------------------------------------------------------------------- #
 #  Export
 # --------------------------------------------------------------------------- #
 
-def _get_audio_duration(audio_path: str) -> float:
-    """Return audio file duration in seconds, or 0.0 if probing fails."""
-    try:
-        info = ffmpeg.probe(audio_path)
-        return float(info["format"].get("duration", 0))
-    except Exception as exc:
-        log.warning("[ffmpeg] could not probe audio duration for %s: %s", audio_path, exc)
-        return 0.0
+# Pre-mix output format: 16-bit stereo PCM at 44.1 kHz
+_MIX_RATE     = 44_100
+_MIX_CHANNELS = 2
+_WAV_HEADER_SIZE = 44
 
 
-def _build_atempo_chain(audio_node, speed: float):
+def _atempo_filter(speed: float) -> str:
     """
-    Chain atempo filters because a single atempo only supports 0.5 – 2.0.
-    E.g. speed=3.0 → atempo(2.0) + atempo(1.5).
+    Return an ``atempo`` filter string, chained because a single atempo only
+    supports 0.5 – 2.0.  E.g. speed=3.0 → ``atempo=2.0,atempo=1.5``.
     """
-    if speed == 1.0:
-        return audio_node
-
     filters = []
     remaining = speed
     while remaining > 2.0:
@@ -203,59 +355,177 @@ def _build_atempo_chain(audio_node, speed: float):
         filters.append(0.5)
         remaining /= 0.5
     filters.append(remaining)
+    return ",".join(f"atempo={f}" for f in filters)
 
-    node = audio_node
-    for f in filters:
-        node = node.filter("atempo", f)
-    return node
 
+@functools.lru_cache(maxsize=None)
+def _rubberband_available() -> bool:
+    """True when the installed ffmpeg was built with the rubberband filter."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-filters"],
+            capture_output=True, text=True, timeout=10,
+        )
+    except Exception as exc:
+        log.debug("[ffmpeg] filter-list probe failed: %s", exc)
+        return False
+    return re.search(r"\srubberband\s", result.stdout) is not None
 
-def _run_ffmpeg_mix_batch(
-    audio_streams: list,
-    duration: float,
-    output_path: str,
-    label: str = "batch",
-) -> None:
-    """Mix *audio_streams* (already built ffmpeg-python nodes) into *output_path*."""
-    if len(audio_streams) == 1:
-        combined = audio_streams[0]
-    else:
-        combined = ffmpeg.filter(
-            audio_streams,
-            "amix",
-            inputs=len(audio_streams),
-            duration="longest",
-            normalize=0,
+
+def _tempo_filter(speed: float) -> str:
+    """
+    Return the filter string for a pitch-preserving *speed* change.
+
+    ``rubberband`` handles any ratio in one node (and sounds better at large
+    ratios); builds without librubberband fall back to an atempo chain.
+    """
+    if 0.25 <= speed <= 4.0 and _rubberband_available():
+        return f"rubberband=tempo={speed}"
+    return _atempo_filter(speed)
+
+
+# Raw PCM as exchanged with ffmpeg over pipes
+_PCM_ARGS = ["-f", "s16le", "-acodec", "pcm_s16le",
+             "-ac", str(_MIX_CHANNELS), "-ar", str(_MIX_RATE)]
+
+
+def _run_pcm_pipe(args: list[str], stdin: bytes | None = None) -> np.ndarray:
+    """
+    Run ``ffmpeg <args> <pcm output> pipe:1`` and return stdout as PCM.
+
+    The argv is built directly rather than through ffmpeg-python nodes;
+    this runs once or twice per caption, so the wrapper's graph objects
+    add up on long caption lists.
+    """
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin",
+           *args, *_PCM_ARGS, "pipe:1"]
+    result = subprocess.run(cmd, input=stdin, capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(
+            result.stderr.decode("utf-8", errors="ignore")[-400:]
+            or f"ffmpeg exited with code {result.returncode}"
         )
-    combined = combined.filter("atrim", duration=duration)
-    out_node = (
-        ffmpeg
-        .output(combined, output_path, acodec="pcm_s16le", ar=44100, threads=0)
-        .overwrite_output()
+    raw = result.stdout
+    usable = len(raw) - len(raw) % (2 * _MIX_CHANNELS)
+    return np.frombuffer(raw[:usable], dtype=np.int16).reshape(-1, _MIX_CHANNELS)
+
+
+def _decode_tts_clip(audio_path: str, speed: float = 1.0) -> np.ndarray:
+    """Decode a TTS clip to 44.1 kHz stereo int16 PCM through an ffmpeg pipe.
+
+    A *speed* other than 1.0 is applied with atempo in the same ffmpeg run.
+    """
+    args = ["-i", audio_path]
+    if speed != 1.0:
+        args += ["-filter:a", _tempo_filter(speed)]
+    return _run_pcm_pipe(args)
+
+
+def _retime_pcm(pcm: np.ndarray, speed: float) -> np.ndarray:
+    """Speed up / slow down decoded PCM, pitch preserved (see ``_tempo_filter``)."""
+    return _run_pcm_pipe(
+        [*_PCM_ARGS, "-i", "pipe:0", "-filter:a", _tempo_filter(speed)],
+        stdin=pcm.tobytes(),
+    )
+
+
+def _wav_header(n_samples: int) -> bytes:
+    """Return a canonical 44-byte PCM WAV header for *n_samples* stereo frames."""
+    block_align = _MIX_CHANNELS * 2
+    data_size   = n_samples * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, _MIX_CHANNELS, _MIX_RATE,
+        _MIX_RATE * block_align, block_align, 16,
+        b"data", data_size,
     )
-    log.debug("[ffmpeg %s] command: %s", label, " ".join(ffmpeg.compile(out_node)))
-    process, tmp_fc = _run_ffmpeg_node_async(out_node, pipe_stderr=True)
+
+
+# Concurrent ffmpeg decode subprocesses used by the pre-mix.  Each decode is
+# its own ffmpeg process, so threads (which just wait on the pipe) are
+# enough to keep every core busy.
+_PRE_MIX_WORKERS = os.cpu_count() or 4
+
+
+def _load_fitted_clip(cap: Caption) -> np.ndarray | None:
+    """Decode *cap*'s TTS clip and retime / trim it to fit the caption window."""
+    # Available playback window for this caption (start → end).
+    window = max(0.01, cap.end - cap.effective_start)
+
+    # The manual speed is applied while decoding; only clips that still
+    # overrun their window need a second atempo pass.
     try:
-        for line in process.stderr:
-            text = line.decode("utf-8", errors="ignore").rstrip()
-            if text:
-                log.debug("[ffmpeg %s] %s", label, text)
-        process.wait()
-    finally:
-        if tmp_fc and os.path.exists(tmp_fc):
-            try:
-                os.remove(tmp_fc)
-            except OSError:
-                pass
-    if process.returncode != 0:
-        raise RuntimeError(
-            f"ffmpeg {label} exited with code {process.returncode}"
+        clip = _decode_tts_clip(cap.tts_audio_path, cap.speed)
+    except (OSError, RuntimeError) as exc:
+        log.warning(
+            "[tts-fit] caption %d: could not decode %s: %s",
+            cap.index, cap.tts_audio_path, exc,
+        )
+        return None
+    if not len(clip):
+        return None
+
+    # If the TTS clip is longer than the window, speed it up just enough
+    # to fit.  Honour any manual cap.speed if it already achieves that.
+    audio_dur = len(clip) / _MIX_RATE
+    if audio_dur > window:
+        extra = audio_dur / window
+        log.debug(
+            "[tts-fit] caption %d: audio=%.3fs  window=%.3fs  "
+            "speed %.2f → %.2f",
+            cap.index, audio_dur, window, cap.speed, cap.speed * extra,
         )
+        try:
+            clip = _retime_pcm(clip, extra)
+        except (OSError, RuntimeError) as exc:
+            log.warning("[tts-fit] caption %d: atempo failed: %s", cap.index, exc)
+            # Untouched clip is still hard-clipped to the window below
+
+    # Hard-clip: prevent audio from overflowing into adjacent captions.
+    return clip[:int(window * _MIX_RATE)]
 
 
-# Each batch of TTS clips is kept below this many inputs so the ffmpeg
-# command line stays well within the Windows 32 767-char CreateProcess limit.
-_TTS_BATCH_SIZE = 30
+def _tts_captions(captions: List[Caption], total: int) -> List[Caption]:
+    """Captions whose TTS clip exists and starts inside the first *total* samples."""
+    return [
+        cap for cap in captions
+        if cap.tts_audio_path and os.path.exists(cap.tts_audio_path)
+        and int(cap.effective_start * _MIX_RATE) < total
+    ]
+
+
+def _place_tts_clips(buf: np.ndarray, tts_caps: List[Caption]) -> int:
+    """
+    Decode *tts_caps* and copy each clip into *buf* at its start sample.
+
+    Clips are decoded by several ffmpeg processes in parallel and placed in
+    caption order.  Overlapping clips are summed in int32 and clipped back
+    to int16.  Returns the number of clips placed.
+    """
+    total = len(buf)
+    placed = 0
+    with ThreadPoolExecutor(
+        max_workers=_PRE_MIX_WORKERS, thread_name_prefix="tts-decode",
+    ) as executor:
+        for cap, clip in zip(tts_caps, executor.map(_load_fitted_clip, tts_caps)):
+            if clip is None:
+                continue
+            start = int(cap.effective_start * _MIX_RATE)
+            n = min(len(clip), total - start)
+            if n <= 0:
+                continue
+
+            region = buf[start:start + n]
+            if region.any():
+                mixed = region.astype(np.int32)
+                mixed += clip[:n]
+                np.clip(mixed, -32768, 32767, out=mixed)
+                region[:] = mixed
+            else:
+                region[:] = clip[:n]
+            placed += 1
+    return placed
 
 
 def _pre_mix_tts_audio(
@@ -266,94 +536,102 @@ def _pre_mix_tts_audio(
     """
     Pre-mix all TTS clips into a single PCM WAV file at *tmp_path*.
 
-    With hundreds of captions each TTS clip is its own ``-i`` input, which
-    can push the ffmpeg command line past Windows' CreateProcess limit even
-    after extracting ``-filter_complex`` to a script.  To avoid this the
-    clips are processed in batches of ``_TTS_BATCH_SIZE``.  Each batch is
-    mixed to a temporary WAV, then all batch WAVs are reduced to the final
-    output file.
+    Instead of an ``adelay``/``apad``/``amix`` filter graph with one input per
+    caption (CPU and memory grow with clips × video length), the output WAV
+    is allocated once as silence and memory-mapped; each clip is decoded to
+    PCM and copied in at its ``effective_start`` sample offset.
 
     Returns True if at least one TTS clip was processed, False otherwise.
     """
-    # ---- Build per-caption streams ----------------------------------------
-    tts_entries: list[tuple[float, object]] = []  # (effective_start, node)
-    for cap in captions:
-        if not cap.tts_audio_path or not os.path.exists(cap.tts_audio_path):
-            continue
-
-        # Available playback window for this caption (start → end).
-        window = max(0.01, cap.end - cap.effective_start)
-
-        # Probe the actual TTS audio duration so we can auto-fit it.
-        audio_dur = _get_audio_duration(cap.tts_audio_path)
-
-        # If the TTS clip is longer than the window, speed it up just enough
-        # to fit.  Honour any manual cap.speed if it already achieves that.
-        effective_speed = cap.speed
-        if audio_dur > 0 and audio_dur > window:
-            auto_speed = audio_dur / window
-            effective_speed = max(cap.speed, auto_speed)
-            log.debug(
-                "[tts-fit] caption %d: audio=%.3fs  window=%.3fs  "
-                "speed %.2f → %.2f",
-                cap.index, audio_dur, window, cap.speed, effective_speed,
-            )
+    total = int(duration * _MIX_RATE)
+    tts_caps = _tts_captions(captions, total) if total > 0 else []
+    if not tts_caps:
+        return False
 
-        tts_node = ffmpeg.input(cap.tts_audio_path).audio
-        tts_node = _build_atempo_chain(tts_node, effective_speed)
+    # Zero-filled (sparse) file: header + silent data section
+    with open(tmp_path, "wb") as fh:
+        fh.write(_wav_header(total))
+        fh.truncate(_WAV_HEADER_SIZE + total * _MIX_CHANNELS * 2)
 
-        # Hard-clip: prevent audio from overflowing into adjacent captions.
-        tts_node = tts_node.filter("atrim", duration=window)
+    buf = np.memmap(
+        tmp_path, dtype=np.int16, mode="r+",
+        offset=_WAV_HEADER_SIZE, shape=(total, _MIX_CHANNELS),
+    )
+    try:
+        placed = _place_tts_clips(buf, tts_caps)
+        buf.flush()
+    finally:
+        del buf
 
-        delay_ms = int(cap.effective_start * 1000)
-        if delay_ms > 0:
-            tts_node = tts_node.filter("adelay", f"{delay_ms}|{delay_ms}")
+    log.debug("[ffmpeg pre-mix] placed %d TTS clip(s) into %s", placed, tmp_path)
+    return placed > 0
 
-        # Pad to exactly the video duration so amix sees a finite-length stream.
-        # Without whole_dur, apad is infinite → amix never ends → 20 GB temp file.
-        tts_node = tts_node.filter("apad", whole_dur=duration)
-        tts_entries.append((cap.effective_start, tts_node))
 
-    if not tts_entries:
-        return False
+def _pre_mix_tts_pcm(captions: List[Caption], duration: float) -> np.ndarray | None:
+    """
+    In-memory variant of :func:`_pre_mix_tts_audio`.
 
-    streams = [node for _, node in tts_entries]
+    Returns the mixed ``(n_samples, 2)`` int16 buffer, ready to be streamed
+    into the export's stdin, or None when no TTS clip was placed.
+    """
+    total = int(duration * _MIX_RATE)
+    tts_caps = _tts_captions(captions, total) if total > 0 else []
+    if not tts_caps:
+        return None
+    buf = np.zeros((total, _MIX_CHANNELS), dtype=np.int16)
+    placed = _place_tts_clips(buf, tts_caps)
+    log.debug("[ffmpeg pre-mix] placed %d TTS clip(s) in memory", placed)
+    return buf if placed else None
 
-    # ---- Fast path: few enough clips to do in a single pass ---------------
-    if len(streams) <= _TTS_BATCH_SIZE:
-        _run_ffmpeg_mix_batch(streams, duration, tmp_path, label="pre-mix")
-        return True
 
-    # ---- Batched path: mix in chunks, then merge batch WAVs ---------------
-    batch_files: list[str] = []
-    try:
-        for batch_start in range(0, len(streams), _TTS_BATCH_SIZE):
-            batch = streams[batch_start: batch_start + _TTS_BATCH_SIZE]
-            tmp_fd, batch_path = tempfile.mkstemp(suffix=f"_tts_batch_{len(batch_files)}.wav")
-            os.close(tmp_fd)
-            batch_files.append(batch_path)
-            log.debug(
-                "[ffmpeg pre-mix] batch %d/%d (%d clips)",
-                len(batch_files),
-                (len(streams) + _TTS_BATCH_SIZE - 1) // _TTS_BATCH_SIZE,
-                len(batch),
-            )
-            _run_ffmpeg_mix_batch(
-                batch, duration, batch_path,
-                label=f"pre-mix batch {len(batch_files)}",
-            )
+# Bytes per write when streaming the pre-mixed PCM into ffmpeg's stdin
+_STDIN_CHUNK = 1 << 20
 
-        # Merge all batch WAVs into the final output
-        merge_streams = [ffmpeg.input(p).audio for p in batch_files]
-        _run_ffmpeg_mix_batch(merge_streams, duration, tmp_path, label="pre-mix merge")
-    finally:
-        for p in batch_files:
+# Windows pipes are slow for bulk PCM and stdin handling there is less
+# predictable, so the pre-mix goes through a temp WAV on that platform.
+_PIPE_PRE_MIX = sys.platform != "win32"
+
+# The piped pre-mix holds the whole track in RAM (44.1 kHz × 2 ch × 2 B ≈
+# 10.6 MB per minute); longer videos use the memory-mapped temp WAV instead.
+_PIPE_PRE_MIX_MAX_S = 20 * 60
+
+
+def _feed_stdin(process: "subprocess.Popen", pcm: np.ndarray) -> threading.Thread:
+    """Write *pcm* to *process*'s stdin on a background thread, then close it."""
+    def _write() -> None:
+        view = memoryview(pcm).cast("B")
+        try:
+            for i in range(0, len(view), _STDIN_CHUNK):
+                process.stdin.write(view[i:i + _STDIN_CHUNK])
+        except (BrokenPipeError, OSError) as exc:
+            # ffmpeg exited early; its return code carries the real error
+            log.debug("[ffmpeg export] stdin closed early: %s", exc)
+        finally:
             try:
-                os.remove(p)
+                process.stdin.close()
             except OSError:
                 pass
 
-    return True
+    thread = threading.Thread(target=_write, name="ffmpeg-stdin", daemon=True)
+    thread.start()
+    return thread
+
+
+def _can_copy_video(video_path: str, output_video_path: str) -> bool:
+    """
+    True when the source video stream can be stream-copied into the output.
+
+    The export only alters audio, so whenever the output container matches
+    the source one the video packets are passed through untouched.
+    """
+    src_ext = os.path.splitext(video_path)[1].lower()
+    dst_ext = os.path.splitext(output_video_path)[1].lower()
+    return bool(src_ext) and src_ext == dst_ext
+
+
+# Intervals OR-ed into a single volume filter's enable expression; keeps
+# each expression short enough for ffmpeg's evaluator.
+_MUTE_RANGES_PER_FILTER = 50
 
 
 def export_video(
@@ -373,12 +651,16 @@ def export_video(
 
     Optimisations vs the naive approach
     ------------------------------------
-    * **Two-pass audio**: all TTS clips are pre-mixed into a single PCM WAV in
-      a fast first pass, so the main ffmpeg command only ever has 2 amix inputs
-      instead of one per caption.  This is the single biggest speed-up.
-    * **CUDA hardware encoding**: uses h264_nvenc if the installed ffmpeg
-      supports it, with a balanced quality/speed preset.  Falls back to
-      libx264 fast + CRF 23.
+    * **Two-pass audio**: all TTS clips are spliced into a single PCM WAV in
+      a fast first pass (direct sample placement, no filter graph), so the
+      main ffmpeg command only ever has 2 amix inputs instead of one per
+      caption.  This is the single biggest speed-up.
+    * **Video stream copy**: when the output container matches the source,
+      the untouched video stream is copied (``-c:v copy``) instead of being
+      re-encoded.
+    * **CUDA hardware encoding**: otherwise uses h264_nvenc if the installed
+      ffmpeg supports it, with a balanced quality/speed preset.  Falls back
+      to libx264 fast + CRF 23.
     * **Hardware decoding**: passes ``hwaccel=cuda`` when NVENC is available
       so the GPU also handles decoding.
     * **Threading**: ``threads=0`` lets ffmpeg pick the optimal thread count.
@@ -393,28 +675,48 @@ def export_video(
         mute_during_captions:   if True, silence orig audio during dubbed segments.
         progress_callback:      optional callable(int 0-100) for progress.
     """
-    duration  = get_video_duration(video_path)
-    use_nvenc = _nvenc_available()
+    # Same container → copy the video stream; no encoder (or NVENC) needed
+    copy_video = _can_copy_video(video_path, output_video_path)
+
+    # NVENC detection (two ffmpeg runs on a cold start) overlaps with the
+    # source probe and the TTS pre-mix; it is only needed for pass 2.
+    nvenc_future = None
+    if not copy_video:
+        nvenc_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nvenc-detect")
+        nvenc_future   = nvenc_executor.submit(_nvenc_available)
+        nvenc_executor.shutdown(wait=False)
+
+    duration = get_video_duration(video_path)
 
     # ------------------------------------------------------------------ #
-    #  Pass 1: pre-mix all TTS clips → temp WAV                           #
+    #  Pass 1: pre-mix all TTS clips → PCM in memory (temp WAV on Windows) #
     # ------------------------------------------------------------------ #
     tmp_tts_path: str | None = None
+    tts_pcm: np.ndarray | None = None
     has_tts = any(
         cap.tts_audio_path and os.path.exists(cap.tts_audio_path)
         for cap in captions
     )
 
     if has_tts:
-        tmp_fd, tmp_tts_path = tempfile.mkstemp(suffix="_tts_mix.wav")
-        os.close(tmp_fd)
         if progress_callback:
             progress_callback(10)
         try:
-            _pre_mix_tts_audio(captions, duration, tmp_tts_path)
+            if _PIPE_PRE_MIX and duration <= _PIPE_PRE_MIX_MAX_S:
+                tts_pcm = _pre_mix_tts_pcm(captions, duration)
+            else:
+                tmp_fd, tmp_tts_path = tempfile.mkstemp(suffix="_tts_mix.wav")
+                os.close(tmp_fd)
+                _pre_mix_tts_audio(captions, duration, tmp_tts_path)
         except Exception as exc:
-            log.error("[ffmpeg pre-mix] failed: %s — continuing without TTS overlay", exc)
             # If pre-mix fails, fall back gracefully (no TTS overlay)
+            log.error("[ffmpeg pre-mix] failed: %s — continuing without TTS overlay", exc)
+            tts_pcm = None
+            if tmp_tts_path and os.path.exists(tmp_tts_path):
+                try:
+                    os.remove(tmp_tts_path)
+                except OSError:
+                    pass
             tmp_tts_path = None
         if progress_callback:
             progress_callback(30)
@@ -422,6 +724,7 @@ def export_video(
     # ------------------------------------------------------------------ #
     #  Pass 2: mux video + mixed audio → output                           #
     # ------------------------------------------------------------------ #
+    use_nvenc = nvenc_future.result() if nvenc_future is not None else False
 
     # Input — enable full CUDA pipeline when NVENC is available:
     #   hwaccel=cuda             → GPU decodes the source video
@@ -437,20 +740,28 @@ def export_video(
     video_stream = src.video
     orig_audio   = src.audio.filter("volume", original_volume)
 
-    # Optionally mute original audio under TTS segments
+    # Optionally mute original audio under TTS segments — one volume node per
+    # chunk of intervals rather than one per caption
     if mute_during_captions and has_tts:
-        for cap in captions:
-            if cap.tts_audio_path and os.path.exists(cap.tts_audio_path):
-                s = cap.effective_start
-                e = cap.end
-                orig_audio = orig_audio.filter(
-                    "volume", 0.0,
-                    enable=f"between(t,{s},{e})",
-                )
+        ranges = [
+            (cap.effective_start, cap.end)
+            for cap in captions
+            if cap.tts_audio_path and os.path.exists(cap.tts_audio_path)
+        ]
+        for i in range(0, len(ranges), _MUTE_RANGES_PER_FILTER):
+            chunk = ranges[i: i + _MUTE_RANGES_PER_FILTER]
+            expr = "+".join(f"between(t,{s},{e})" for s, e in chunk)
+            orig_audio = orig_audio.filter("volume", 0.0, enable=expr)
 
     # Final audio mix — always just 2 inputs now
-    if tmp_tts_path and os.path.exists(tmp_tts_path):
-        tts_mixed = ffmpeg.input(tmp_tts_path).audio
+    if tts_pcm is not None or (tmp_tts_path and os.path.exists(tmp_tts_path)):
+        if tts_pcm is not None:
+            tts_mixed = ffmpeg.input(
+                "pipe:0", format="s16le", acodec="pcm_s16le",
+                ac=_MIX_CHANNELS, ar=_MIX_RATE,
+            ).audio
+        else:
+            tts_mixed = ffmpeg.input(tmp_tts_path).audio
         mixed_audio = ffmpeg.filter(
             [orig_audio, tts_mixed],
             "amix",
@@ -462,15 +773,19 @@ def export_video(
         mixed_audio = orig_audio
 
     # Codec selection
-    if use_nvenc:
+    if copy_video:
+        # Video is untouched — pass the packets through, no re-encode
+        video_codec_kwargs: dict = {"vcodec": "copy"}
+    elif use_nvenc:
         # NVIDIA GPU H.264 — p4 = balanced speed/quality, cq=23 ≈ CRF 23
-        video_codec_kwargs: dict = {
+        video_codec_kwargs = {
             "vcodec":  "h264_nvenc",
             "preset":  "p4",
             "rc":      "vbr",
             "cq":      23,
             "b:v":     "0",
             "profile:v": "high",
+            **_NVENC_TUNING_KWARGS,
         }
     else:
         # CPU fallback — fast preset + CRF 23 gives good quality/speed balance
@@ -490,7 +805,7 @@ def export_video(
         audio_bitrate="192k",
         movflags="+faststart",
         threads=0,
-    ).overwrite_output()
+    ).global_args("-progress", "pipe:1", "-nostats").overwrite_output()
 
     log.info(
         "[ffmpeg export] codec=%s  nvenc=%s  output=%s",
@@ -499,34 +814,38 @@ def export_video(
     log.debug("[ffmpeg export] command: %s", " ".join(ffmpeg.compile(out)))
 
     # ------------------------------------------------------------------ #
-    #  Run with progress tracking via stderr                              #
+    #  Run with progress tracking via -progress on stdout                 #
     # ------------------------------------------------------------------ #
     tmp_fc: str | None = None
     try:
-        process, tmp_fc = _run_ffmpeg_node_async(out, pipe_stderr=True)
+        # The output goes to a file, so stdout carries only the key=value
+        # progress blocks; stderr is drained separately for error reporting.
+        process, tmp_fc = _run_ffmpeg_node_async(
+            out, pipe_stderr=True, pipe_stdout=True, pipe_stdin=tts_pcm is not None,
+        )
+        stdin_thread = _feed_stdin(process, tts_pcm) if tts_pcm is not None else None
+        # Only the tail is needed for the error message
+        stderr_tail: collections.deque[bytes] = collections.deque(maxlen=20)
+        stderr_thread = _drain_stderr(process, stderr_tail, "export")
         # Weight this phase as 30–100 % of total
         base_pct = 30 if has_tts else 5
         span_pct = 100 - base_pct
-        stderr_lines: list[str] = []
-        for line in process.stderr:
-            text = line.decode("utf-8", errors="ignore").rstrip()
-            if text:
-                log.debug("[ffmpeg export] %s", text)
-                stderr_lines.append(text)
-            if progress_callback:
-                m = re.search(r"time=(\d+):(\d+):(\d+\.\d+)", text)
-                if m and duration:
-                    elapsed = (
-                        int(m.group(1)) * 3600
-                        + int(m.group(2)) * 60
-                        + float(m.group(3))
-                    )
-                    pct = base_pct + int(min(elapsed / duration, 1.0) * span_pct * 0.99)
-                    progress_callback(pct)
+        for line in process.stdout:
+            if not (progress_callback and duration and line.startswith(_PROGRESS_TIME_KEY)):
+                continue
+            try:
+                elapsed = int(line[len(_PROGRESS_TIME_KEY):]) / 1_000_000
+            except ValueError:      # "N/A" before the first frame
+                continue
+            pct = base_pct + int(min(elapsed / duration, 1.0) * span_pct * 0.99)
+            progress_callback(pct)
         process.wait()
+        stderr_thread.join()
+        if stdin_thread is not None:
+            stdin_thread.join()
         if process.returncode and process.returncode != 0:
             # Surface the last few stderr lines so the error message is useful
-            tail = "\n".join(stderr_lines[-20:])
+            tail = b"\n".join(stderr_tail).decode("utf-8", errors="ignore")
             raise RuntimeError(
                 f"ffmpeg exited with code {process.returncode}\n{tail}"
             )
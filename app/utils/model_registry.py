@@ -0,0 +1,86 @@
+"""Process-wide registry for heavy (GPU-resident) models.
+
+Loading a Whisper model takes seconds and several GB of (V)RAM, so the
+loaded instance is kept between runs.  At most one heavy model is held at
+a time: asking for a different one releases the previous model first, and
+pipeline stages that do not need it can call :func:`release` to hand the
+memory back before they start.
+"""
+from __future__ import annotations
+
+import gc
+import logging
+import sys
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+# kind → (key the model was loaded with, loaded object)
+_models: Dict[str, Tuple[Hashable, Any]] = {}
+
+# Serialises loads.  _lock is only held for bookkeeping, never while a
+# loader runs, so release() on the GUI thread does not wait for a load.
+_load_lock = threading.Lock()
+_loading: Optional[str] = None     # kind currently being loaded
+_load_dropped = False              # release() hit that kind mid-load
+
+
+def get(kind: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+    """Return the model of *kind* loaded for *key*, calling *loader* on a miss.
+
+    Any other model currently held (of any kind, or of this kind with a
+    different key) is released before *loader* runs.  If :func:`release`
+    drops *kind* while it is loading, the model is returned to this caller
+    but not kept.
+    """
+    global _loading, _load_dropped
+    with _load_lock:
+        with _lock:
+            entry = _models.get(kind)
+            if entry is not None and entry[0] == key:
+                log.info("[models] reusing %s %s", kind, key)
+                return entry[1]
+            _release_locked(None)
+            _loading, _load_dropped = kind, False
+        log.info("[models] loading %s %s", kind, key)
+        try:
+            value = loader()
+        except BaseException:
+            with _lock:
+                _loading = None
+            raise
+        with _lock:
+            if _load_dropped:
+                log.info("[models] %s released while loading; not kept", kind)
+            else:
+                _models[kind] = (key, value)
+            _loading = None
+        return value
+
+
+def release(kind: Optional[str] = None) -> None:
+    """Drop the model of *kind* (or every model when None) and free its memory."""
+    global _load_dropped
+    with _lock:
+        if _loading is not None and kind in (None, _loading):
+            _load_dropped = True
+        _release_locked(kind)
+
+
+def _release_locked(kind: Optional[str]) -> None:
+    kinds = list(_models) if kind is None else [kind]
+    dropped = [k for k in kinds if _models.pop(k, None) is not None]
+    if not dropped:
+        return
+    log.info("[models] released %s", ", ".join(dropped))
+    gc.collect()
+    # Only touch torch if something already imported it
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        try:
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception as exc:
+            log.debug("[models] torch.cuda.empty_cache failed: %s", exc)
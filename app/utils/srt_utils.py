@@ -1,8 +1,12 @@
 """SRT subtitle file read/write utilities."""
 from __future__ import annotations
 
+import mmap
+import os
 import re
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from app.models.caption import Caption
 
@@ -19,20 +23,55 @@ def _ts_to_seconds(ts: str) -> float:
     return h * 3600 + m * 60 + s
 
 
+# Byte columns of the digits in a canonical ``HH:MM:SS,mmm --> HH:MM:SS,mmm`` line
+_TIMING_DIGITS = np.array([0, 1, 3, 4, 6, 7, 9, 10, 11, 17, 18, 20, 21, 23, 24, 26, 27, 28])
+
+
+def _timings_to_seconds(timings: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse a batch of canonical timing lines in one vectorised pass.
+
+    Returns ``(start, end, ok)``; rows where ``ok`` is False had a non-digit
+    in a digit column and must be parsed another way.
+    """
+    raw = np.frombuffer(
+        "".join(timings).encode("ascii", "replace"), dtype=np.uint8,
+    ).reshape(-1, 29)
+    # uint8 wrap-around turns anything below "0" into a large value too
+    digits = (raw[:, _TIMING_DIGITS] - ord("0")).astype(np.int64)
+    ok = (digits <= 9).all(axis=1)
+
+    def _secs(d: np.ndarray) -> np.ndarray:
+        whole = (d[:, 0] * 10 + d[:, 1]) * 3600 + (d[:, 2] * 10 + d[:, 3]) * 60 + d[:, 4] * 10 + d[:, 5]
+        return whole + (d[:, 6] * 100 + d[:, 7] * 10 + d[:, 8]) * 0.001
+
+    return _secs(digits[:, :9]), _secs(digits[:, 9:]), ok
+
+
 def seconds_to_ts(seconds: float) -> str:
     """Convert seconds to SRT timestamp HH:MM:SS,mmm."""
-    assert seconds >= 0
-    ms = round(seconds * 1000)
-    h  = ms // 3_600_000;  ms -= h * 3_600_000
-    m  = ms //    60_000;  ms -= m *    60_000
-    s  = ms //     1_000;  ms -= s *     1_000
+    assert seconds >= 0     # compiled out under -O
+    s, ms = divmod(round(seconds * 1000), 1000)
+    m, s  = divmod(s, 60)
+    h, m  = divmod(m, 60)
     return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
 
+def seconds_to_ts_vec(seconds: np.ndarray) -> List[str]:
+    """Vectorised :func:`seconds_to_ts` for an array of times."""
+    s, ms = np.divmod(np.round(seconds * 1000).astype(np.int64), 1000)
+    m, s  = np.divmod(s, 60)
+    h, m  = np.divmod(m, 60)
+    return [
+        f"{hh:02d}:{mm:02d}:{ss:02d},{mss:03d}"
+        for hh, mm, ss, mss in zip(h.tolist(), m.tolist(), s.tolist(), ms.tolist())
+    ]
+
+
 # --------------------------------------------------------------------------- #
 #  Parse
 # --------------------------------------------------------------------------- #
 
+# Fallback for blocks the fast path rejects (odd spacing, "." millis, …)
 _BLOCK_RE = re.compile(
     r"(\d+)\s*\n"
     r"(\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}[,\.]\d{3})\s*\n"
@@ -41,22 +80,116 @@ _BLOCK_RE = re.compile(
 )
 
 
-def parse_srt(path: str) -> List[Caption]:
-    """Read an SRT file and return a list of Caption objects."""
-    with open(path, "r", encoding="utf-8-sig") as fh:
-        content = fh.read()
+def _split_block_fast(block: str) -> Optional[Tuple[int, str, str]]:
+    """Split a canonical SRT block into ``(index, timing line, text)``.
 
+    Canonical timing line: ``HH:MM:SS,mmm --> HH:MM:SS,mmm`` (29 chars).
+    Returns None if the block does not conform.
+    """
+    nl1 = block.find("\n")
+    if nl1 < 0:
+        return None
+    nl2 = block.find("\n", nl1 + 1)
+    timing = block[nl1 + 1: nl2 if nl2 >= 0 else len(block)].rstrip()
+    if (
+        len(timing) != 29 or timing[12:17] != " --> "
+        or timing[2] != ":" or timing[5] != ":" or timing[8] != ","
+        or timing[19] != ":" or timing[22] != ":" or timing[25] != ","
+    ):
+        return None
+    try:
+        idx = int(block[:nl1])
+    except ValueError:
+        return None
+    text = block[nl2 + 1:].strip() if nl2 >= 0 else ""
+    return idx, timing, text
+
+
+def _parse_block_regex(block: str) -> List[Caption]:
     captions: List[Caption] = []
-    for m in _BLOCK_RE.finditer(content):
+    for m in _BLOCK_RE.finditer(block):
         idx   = int(m.group(1))
         start = _ts_to_seconds(m.group(2))
         end   = _ts_to_seconds(m.group(3))
         text  = m.group(4).strip()
         captions.append(Caption(index=idx, start=start, end=end, original_text=text))
-
     return captions
 
 
+_BOM = b"\xef\xbb\xbf"
+
+
+def _iter_blocks(path: str) -> Iterator[str]:
+    """Yield the blank-line separated blocks of an SRT file, decoded one by one.
+
+    The file is memory-mapped, so it is paged in on demand and never held
+    as a whole ``bytes`` + ``str`` pair.
+    """
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = len(_BOM) if mm[:len(_BOM)] == _BOM else 0
+        crlf = mm.find(b"\r\n", pos, pos + 4096) >= 0
+        sep = b"\r\n\r\n" if crlf else b"\n\n"
+        size = len(mm)
+        while pos < size:
+            end = mm.find(sep, pos)
+            if end < 0:
+                end = size
+            block = mm[pos:end].decode("utf-8")
+            yield block.replace("\r\n", "\n") if crlf else block
+            pos = end + len(sep)
+
+
+# Canonical blocks whose timestamps are converted together
+_PARSE_BATCH = 1024
+
+
+def _flush_canonical(pending: List[Tuple[str, Tuple[int, str, str]]]) -> Iterator[Caption]:
+    starts, ends, ok = _timings_to_seconds([timing for _, (_, timing, _) in pending])
+    for (block, (idx, _, text)), start, end, good in zip(
+        pending, starts.tolist(), ends.tolist(), ok.tolist(),
+    ):
+        if good:
+            yield Caption(index=idx, start=start, end=end, original_text=text)
+        else:
+            yield from _parse_block_regex(block)
+
+
+def iter_srt(path: str) -> Iterator[Caption]:
+    """Yield the Caption objects of an SRT file as its blocks are parsed.
+
+    Blocks are split on blank lines and sliced apart; the timestamps of
+    canonical blocks are parsed in batches with NumPy, and only blocks that
+    are not in canonical form go through the regex.
+    """
+    pending: List[Tuple[str, Tuple[int, str, str]]] = []
+    for block in _iter_blocks(path):
+        block = block.strip()
+        if not block:
+            continue
+        parts = _split_block_fast(block)
+        if parts is not None:
+            pending.append((block, parts))
+            if len(pending) >= _PARSE_BATCH:
+                yield from _flush_canonical(pending)
+                pending = []
+            continue
+        # Keep file order: emit the batch before the odd block
+        if pending:
+            yield from _flush_canonical(pending)
+            pending = []
+        yield from _parse_block_regex(block)
+    if pending:
+        yield from _flush_canonical(pending)
+
+
+def parse_srt(path: str) -> List[Caption]:
+    """Read an SRT file and return a list of Caption objects."""
+    return list(iter_srt(path))
+
+
 # --------------------------------------------------------------------------- #
 #  Write
 # --------------------------------------------------------------------------- #
@@ -70,11 +203,17 @@ def write_srt(captions: List[Caption], path: str, use_khmer: bool = True) -> Non
         use_khmer: if True, write ``khmer_text`` (falls back to ``original_text``
                    when the Khmer text is empty).
     """
+    if use_khmer:
+        texts = (cap.khmer_text or cap.original_text for cap in captions)
+    else:
+        texts = (cap.original_text for cap in captions)
+    n = len(captions)
+    starts = seconds_to_ts_vec(np.fromiter((cap.start for cap in captions), float, n))
+    ends   = seconds_to_ts_vec(np.fromiter((cap.end for cap in captions), float, n))
+    # Build the whole file in memory and hand it to the OS in one write
+    parts = [
+        f"{i}\n{start} --> {end}\n{text}\n\n"
+        for i, (start, end, text) in enumerate(zip(starts, ends, texts), start=1)
+    ]
     with open(path, "w", encoding="utf-8") as fh:
-        for i, cap in enumerate(captions, start=1):
-            text = (cap.khmer_text or cap.original_text) if use_khmer else cap.original_text
-            fh.write(
-                f"{i}\n"
-                f"{seconds_to_ts(cap.start)} --> {seconds_to_ts(cap.end)}\n"
-                f"{text}\n\n"
-            )
+        fh.write("".join(parts))
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QAction, QColor, QFont, QFontDatabase, QKeySequence
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal, Slot
+from PySide6.QtGui import (
+    QAction, QColor, QFont, QFontDatabase, QKeySequence, QStandardItem, QStandardItemModel,
+)
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
@@ -13,8 +15,8 @@ from PySide6.QtWidgets import (
     QHeaderView,
     QLabel,
     QMenu,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyledItemDelegate,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -35,15 +37,216 @@ COL_VOICE   = 7
 
 HEADERS = ["#", "Start (s)", "End (s)", "Original Text", "Khmer Text", "Speed ×", "Offset (s)", "Voice"]
 
-_EDITABLE_COLS = {COL_ORIG, COL_KHMER, COL_START, COL_END, COL_SPEED, COL_OFFSET}
+_EDITABLE_COLS = {COL_ORIG, COL_KHMER, COL_START, COL_END, COL_SPEED, COL_OFFSET, COL_VOICE}
+
+_VOICE_LABELS = {value: label for label, value in KHMER_VOICES.items()}
+
+# Background of rows whose TTS audio has been generated
+_TTS_DONE_BRUSH = QColor("#d4edda")
 
 
 def _fmt(v: float) -> str:
     return f"{v:.3f}"
 
 
+def _voice_of(cap: Caption) -> str:
+    """Return the caption's voice, falling back to the default for unknown ones."""
+    return cap.voice if cap.voice in _VOICE_LABELS else DEFAULT_VOICE
+
+
+class CaptionModel(QAbstractTableModel):
+    """Table model over a list of :class:`Caption` objects.
+
+    Cells are formatted on demand in :meth:`data`, so only the rows the
+    view actually paints cost anything.
+    """
+
+    def __init__(self, khmer_font: QFont, parent=None):
+        super().__init__(parent)
+        self._captions: List[Caption] = []
+        # cap.index → row, kept in step with every change to row order
+        self._index_to_row: Dict[int, int] = {}
+        self._khmer_font = khmer_font
+
+    # ------------------------------------------------------------------ Qt API
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._captions)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex):
+        flags = super().flags(index)
+        if index.column() in _EDITABLE_COLS:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        cap = self._captions[row]
+        if role == Qt.DisplayRole:
+            if col == COL_IDX:
+                # display row position, not cap.index (which has gaps after deletion)
+                return str(row + 1)
+            if col == COL_START:
+                return _fmt(cap.start)
+            if col == COL_END:
+                return _fmt(cap.end)
+            if col == COL_ORIG:
+                return cap.original_text
+            if col == COL_KHMER:
+                return cap.khmer_text
+            if col == COL_SPEED:
+                return _fmt(cap.speed)
+            if col == COL_OFFSET:
+                return _fmt(cap.offset)
+            if col == COL_VOICE:
+                return _VOICE_LABELS[_voice_of(cap)]
+        elif role == Qt.EditRole:
+            if col == COL_VOICE:
+                return _voice_of(cap)
+            return self.data(index, Qt.DisplayRole)
+        elif role == Qt.FontRole:
+            if col == COL_KHMER:
+                return self._khmer_font
+        elif role == Qt.BackgroundRole:
+            if cap.tts_audio_path:
+                return _TTS_DONE_BRUSH
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        col = index.column()
+        cap = self._captions[index.row()]
+        text = str(value).strip()
+
+        try:
+            if col == COL_ORIG:
+                cap.original_text = text
+            elif col == COL_KHMER:
+                cap.khmer_text = text
+            elif col == COL_START:
+                cap.start = float(text)
+            elif col == COL_END:
+                cap.end = float(text)
+            elif col == COL_SPEED:
+                val = float(text)
+                cap.speed = max(0.25, min(4.0, val))
+            elif col == COL_OFFSET:
+                cap.offset = float(text)
+            elif col == COL_VOICE:
+                cap.voice = text or DEFAULT_VOICE
+        except ValueError:
+            return False    # keep old value on bad input
+
+        self.dataChanged.emit(index, index)
+        return True
+
+    # ------------------------------------------------------------------ helpers
+    @property
+    def captions(self) -> List[Caption]:
+        return self._captions
+
+    def row_for_index(self, caption_index: int) -> Optional[int]:
+        return self._index_to_row.get(caption_index)
+
+    def _reindex(self) -> None:
+        self._index_to_row = {cap.index: row for row, cap in enumerate(self._captions)}
+
+    def set_captions(self, captions: List[Caption]) -> None:
+        self.beginResetModel()
+        self._captions = captions
+        self._reindex()
+        self.endResetModel()
+
+    def extend(self, captions: List[Caption]) -> None:
+        if not captions:
+            return
+        first = len(self._captions)
+        self.beginInsertRows(QModelIndex(), first, first + len(captions) - 1)
+        self._captions.extend(captions)
+        for row, cap in enumerate(captions, first):
+            self._index_to_row[cap.index] = row
+        self.endInsertRows()
+
+    def replace(self, row: int, cap: Caption) -> None:
+        self._index_to_row.pop(self._captions[row].index, None)
+        self._captions[row] = cap
+        self._index_to_row[cap.index] = row
+        self.refresh_row(row)
+
+    def refresh_row(
+        self, row: int, first_col: int = 0, last_col: int = len(HEADERS) - 1,
+        roles: Sequence[int] = (),
+    ) -> None:
+        """Tell views that *row* changed; *roles* narrows what they re-query."""
+        self.dataChanged.emit(self.index(row, first_col), self.index(row, last_col), list(roles))
+
+    def remove_rows(self, rows: Iterable[int]) -> None:
+        """Remove *rows* and renumber the ``#`` column of the rows after them."""
+        rows = sorted({r for r in rows if 0 <= r < len(self._captions)}, reverse=True)
+        if not rows:
+            return
+        # One beginRemoveRows per contiguous run, bottom-up so indices stay valid
+        last = first = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == first - 1:
+                first = row
+                continue
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._captions[first:last + 1]
+            self.endRemoveRows()
+            last = first = row
+        self._reindex()
+        if rows[-1] < len(self._captions):
+            self.dataChanged.emit(
+                self.index(rows[-1], COL_IDX), self.index(len(self._captions) - 1, COL_IDX),
+            )
+
+
+class _VoiceDelegate(QStyledItemDelegate):
+    """Voice column editor: a QComboBox created only while a cell is edited.
+
+    Every editor shares one voice list model built at construction.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._voice_model = QStandardItemModel(self)
+        for label, value in KHMER_VOICES.items():
+            item = QStandardItem(label)
+            item.setData(value, Qt.UserRole)
+            self._voice_model.appendRow(item)
+        self._voice_index_by_value = {value: i for i, value in enumerate(KHMER_VOICES.values())}
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.setModel(self._voice_model)
+        # Commit as soon as a voice is picked instead of waiting for focus-out
+        combo.activated.connect(lambda _i, c=combo: self._commit(c))
+        return combo
+
+    def setEditorData(self, editor: QComboBox, index) -> None:
+        editor.setCurrentIndex(self._voice_index_by_value.get(index.data(Qt.EditRole), 0))
+
+    def setModelData(self, editor: QComboBox, model, index) -> None:
+        model.setData(index, editor.currentData(), Qt.EditRole)
+
+    def _commit(self, editor: QComboBox) -> None:
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+
 class CaptionTable(QWidget):
-    """QTableWidget wrapper exposing caption data with edit callbacks.
+    """QTableView over a :class:`CaptionModel`, exposing caption edit callbacks.
 
     Signals
     -------
@@ -57,9 +260,9 @@ class CaptionTable(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._captions: List[Caption] = []
         self._ignore_changes = False
         self._khmer_font = self._load_khmer_font()
+        self.model = CaptionModel(self._khmer_font, self)
         self._build_ui()
 
     # ------------------------------------------------------------------ build
@@ -73,8 +276,9 @@ class CaptionTable(QWidget):
         return QFont()  # fallback to default
 
     def _build_ui(self) -> None:
-        self.table = QTableWidget(0, len(HEADERS))
-        self.table.setHorizontalHeaderLabels(HEADERS)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(COL_VOICE, _VoiceDelegate(self.table))
 
         hdr = self.table.horizontalHeader()
         hdr.setSectionResizeMode(COL_ORIG,  QHeaderView.Stretch)
@@ -84,8 +288,8 @@ class CaptionTable(QWidget):
 
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setAlternatingRowColors(True)
-        self.table.itemChanged.connect(self._on_item_changed)
-        self.table.cellClicked.connect(self._on_cell_clicked)
+        self.model.dataChanged.connect(self._on_data_changed)
+        self.table.clicked.connect(self._on_cell_clicked)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._show_context_menu)
         self.table.keyPressEvent = self._table_key_press
@@ -96,149 +300,101 @@ class CaptionTable(QWidget):
         layout.addWidget(self.table)
 
     # ------------------------------------------------------------------ API
-    def load_captions(self, captions: List[Caption]) -> None:
-        """Replace the table contents with a new caption list."""
-        self._captions = list(captions)
-        self._rebuild()
+    def load_captions(self, captions: Iterable[Caption]) -> None:
+        """Replace the table contents with *captions* (any iterable, e.g. iter_srt).
+
+        The whole list goes in with one model reset while repaints are suspended.
+        """
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_captions(list(captions))
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    def append_captions(self, captions: List[Caption]) -> None:
+        """Insert or replace captions keyed by ``cap.index``.
+
+        Used while a transcription is still streaming in: new indices are
+        appended as rows, known ones are overwritten in place so
+        ``update_khmer_text`` / ``update_tts_path`` keep matching them.
+        """
+        self._ignore_changes = True
+        self.table.setUpdatesEnabled(False)
+        try:
+            new: List[Caption] = []
+            for cap in captions:
+                row = self._row_for_index(cap.index)
+                if row is None:
+                    new.append(cap)
+                else:
+                    self.model.replace(row, cap)
+            self.model.extend(new)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self._ignore_changes = False
 
     def get_captions(self) -> List[Caption]:
         """Return the current (possibly edited) caption list.
 
-        Reads the per-row Voice combo widgets so cap.voice is always up-to-date.
+        Unknown or empty voices are resolved to the default, matching what
+        the Voice column shows.
         """
-        for row, cap in enumerate(self._captions):
-            combo: QComboBox = self.table.cellWidget(row, COL_VOICE)
-            if combo is not None:
-                cap.voice = combo.currentData() or DEFAULT_VOICE
-        return list(self._captions)
+        for cap in self.model.captions:
+            cap.voice = _voice_of(cap)
+        return list(self.model.captions)
 
     def update_khmer_text(self, caption_index: int, text: str) -> None:
         """Set the Khmer text for a specific caption index (1-based)."""
-        for cap in self._captions:
-            if cap.index == caption_index:
-                cap.khmer_text = text
-                break
-        self._update_cell_text(caption_index, COL_KHMER, text)
-
-    def update_tts_path(self, caption_index: int, path: str) -> None:
-        """Record the TTS audio path and colour the row green."""
-        for cap in self._captions:
-            if cap.index == caption_index:
-                cap.tts_audio_path = path
-                break
         row = self._row_for_index(caption_index)
-        if row is not None:
-            for col in range(len(HEADERS)):
-                item = self.table.item(row, col)
-                if item:
-                    item.setBackground(QColor("#d4edda"))
-
-    def clear(self) -> None:
-        self._captions = []
-        self.table.setRowCount(0)
-
-    # ------------------------------------------------------------------ internals
-    def _rebuild(self) -> None:
+        if row is None:
+            return
+        self.model.captions[row].khmer_text = text
         self._ignore_changes = True
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(self._captions))
-
-        for row, cap in enumerate(self._captions):
-            self._set_row(row, cap)
-
+        self.model.refresh_row(row, COL_KHMER, COL_KHMER)
         self._ignore_changes = False
 
-    def _set_row(self, row: int, cap: Caption) -> None:
-        items = [
-            str(row + 1),   # display row position, not cap.index (which has gaps after deletion)
-            _fmt(cap.start),
-            _fmt(cap.end),
-            cap.original_text,
-            cap.khmer_text,
-            _fmt(cap.speed),
-            _fmt(cap.offset),
-        ]
-        for col, text in enumerate(items):
-            item = QTableWidgetItem(text)
-            if col not in _EDITABLE_COLS:
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            if col == COL_KHMER:
-                item.setFont(self._khmer_font)
-            self.table.setItem(row, col, item)
-
-        # Voice combo (col 7)
-        voice_combo = QComboBox()
-        for label, value in KHMER_VOICES.items():
-            voice_combo.addItem(label, value)
-        # Select current voice (default to first item = Female)
-        target = cap.voice or DEFAULT_VOICE
-        idx = voice_combo.findData(target)
-        if idx >= 0:
-            voice_combo.setCurrentIndex(idx)
-        self.table.setCellWidget(row, COL_VOICE, voice_combo)
-
-    def _row_for_index(self, caption_index: int) -> Optional[int]:
-        for row, cap in enumerate(self._captions):
-            if cap.index == caption_index:
-                return row
-        return None
-
-    def _update_cell_text(self, caption_index: int, col: int, text: str) -> None:
+    def update_tts_path(self, caption_index: int, path: str) -> None:
+        """Record the TTS audio path and colour the row green."""
         row = self._row_for_index(caption_index)
         if row is None:
             return
+        self.model.captions[row].tts_audio_path = path
         self._ignore_changes = True
-        item = self.table.item(row, col)
-        if item:
-            item.setText(text)
+        # Only the row tint depends on the path; BackgroundRole repaints it in one go
+        self.model.refresh_row(row, roles=(Qt.BackgroundRole,))
         self._ignore_changes = False
 
-    # ------------------------------------------------------------------ slots
-    @Slot(QTableWidgetItem)
-    def _on_item_changed(self, item: QTableWidgetItem) -> None:
-        if self._ignore_changes:
-            return
-        row = item.row()
-        col = item.column()
-        if row >= len(self._captions):
-            return
-
-        cap  = self._captions[row]
-        text = item.text().strip()
+    def clear(self) -> None:
+        self.model.set_captions([])
 
-        try:
-            if col == COL_ORIG:
-                cap.original_text = text
-            elif col == COL_KHMER:
-                cap.khmer_text = text
-            elif col == COL_START:
-                cap.start = float(text)
-            elif col == COL_END:
-                cap.end = float(text)
-            elif col == COL_SPEED:
-                val = float(text)
-                cap.speed = max(0.25, min(4.0, val))
-            elif col == COL_OFFSET:
-                cap.offset = float(text)
-        except ValueError:
-            pass    # keep old value on bad input
+    # ------------------------------------------------------------------ internals
+    def _row_for_index(self, caption_index: int) -> Optional[int]:
+        return self.model.row_for_index(caption_index)
 
-        self.data_changed.emit()
+    # ------------------------------------------------------------------ slots
+    @Slot(QModelIndex, QModelIndex)
+    def _on_data_changed(self, _top_left: QModelIndex, _bottom_right: QModelIndex) -> None:
+        if not self._ignore_changes:
+            self.data_changed.emit()
 
-    @Slot(int, int)
-    def _on_cell_clicked(self, row: int, _col: int) -> None:
-        if row < len(self._captions):
-            self.caption_selected.emit(self._captions[row].start)
+    @Slot(QModelIndex)
+    def _on_cell_clicked(self, index: QModelIndex) -> None:
+        row = index.row()
+        if row < self.model.rowCount():
+            self.caption_selected.emit(self.model.captions[row].start)
 
     def _table_key_press(self, event) -> None:
         if event.key() == Qt.Key_Delete:
             self._delete_selected_rows()
         else:
-            QTableWidget.keyPressEvent(self.table, event)
+            QTableView.keyPressEvent(self.table, event)
+
+    def _selected_rows(self) -> set:
+        return {idx.row() for idx in self.table.selectionModel().selectedIndexes()}
 
     @Slot()
     def _show_context_menu(self, pos) -> None:
-        rows = {idx.row() for idx in self.table.selectedIndexes()}
+        rows = self._selected_rows()
         if not rows:
             return
         menu = QMenu(self)
@@ -249,15 +405,18 @@ class CaptionTable(QWidget):
         menu.exec(self.table.viewport().mapToGlobal(pos))
 
     def _delete_selected_rows(self) -> None:
-        rows = sorted({idx.row() for idx in self.table.selectedIndexes()}, reverse=True)
+        rows = self._selected_rows()
         if not rows:
             return
-        for row in rows:
-            if row < len(self._captions):
-                self._captions.pop(row)
         # Do NOT re-number cap.index — it is the stable key used for TTS file
         # naming and signal matching. Changing it after TTS has already been
         # generated (or is about to be) would cause audio files to be written
         # to wrong paths or matched to the wrong captions.
-        self._rebuild()
+        self._ignore_changes = True
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.remove_rows(rows)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self._ignore_changes = False
         self.data_changed.emit()
@@ -1,7 +1,7 @@
 """Modal loading dialog shown during long background tasks."""
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 from PySide6.QtWidgets import (
     QDialog,
     QLabel,
@@ -14,14 +14,17 @@ from PySide6.QtWidgets import (
 class LoadingDialog(QDialog):
     """Blocking modal dialog with a progress bar and status message.
 
+    One instance is created up-front and reused for every job.
+
     Usage
     -----
-    dlg = LoadingDialog(parent, title="Whisper Transcription",
-                        message="Transcribing audio with Whisper…\\nThis may take a while.")
-    worker.progress.connect(dlg.set_progress)
-    worker.finished.connect(dlg.close)
+    dlg = LoadingDialog(parent)
     dlg.cancel_requested.connect(some_slot)
-    dlg.show()          # non-blocking show; the worker runs in a QThread
+    ...
+    dlg.reset("Whisper Transcription", "Transcribing audio with Whisper…\\nThis may take a while.")
+    dlg.bind(worker)    # closes the dialog when worker.finished fires
+    worker.progress.connect(dlg.set_progress)
+    dlg.show()          # non-blocking show; the worker runs in the background
     """
 
     cancel_requested = Signal()
@@ -65,8 +68,32 @@ class LoadingDialog(QDialog):
         self._cancel_btn.clicked.connect(self._on_cancel_clicked)
         layout.addWidget(self._cancel_btn)
 
+        self._connections: list = []   # worker connections made by bind()
+
+        self.adjustSize()
+
+    # ------------------------------------------------------------------ API
+    def reset(self, title: str, message: str) -> None:
+        """Prepare the dialog for a new job and drop the previous job's bindings."""
+        self.unbind()
+        self.setWindowTitle(title)
+        self._label.setText(message)
+        self._bar.setValue(0)
+        self._cancel_btn.setEnabled(True)
+        self._cancel_btn.setText("\U0001f6ab  Cancel")
         self.adjustSize()
 
+    def bind(self, worker: QObject) -> list:
+        """Close the dialog when *worker* finishes; returns the connections made."""
+        self._connections.append(worker.finished.connect(self.close))
+        return list(self._connections)
+
+    def unbind(self) -> None:
+        """Disconnect everything set up by bind()."""
+        for conn in self._connections:
+            QObject.disconnect(conn)
+        self._connections.clear()
+
     # ------------------------------------------------------------------ slots
     def set_progress(self, value: int) -> None:
         """Update the progress bar (0–100)."""
@@ -1,10 +1,13 @@
 """Log viewer dialog — shows live application logs in a popup window."""
 from __future__ import annotations
 
+import collections
 import logging
 
-from PySide6.QtCore import QObject, Qt, Signal, Slot
-from PySide6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor, QKeySequence, QAction
+from PySide6.QtCore import QObject, Qt, QTimer, Signal, Slot
+from PySide6.QtGui import (
+    QAction, QColor, QFont, QKeySequence, QSyntaxHighlighter, QTextCharFormat, QTextCursor,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -12,8 +15,8 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QPlainTextEdit,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -71,11 +74,56 @@ _LEVEL_COLORS: dict[int, str] = {
 }
 
 
+# Resolved colour per level number; standard levels are pre-filled and
+# custom levels are added on first use.
+_COLOR_CACHE: dict[int, str] = dict(_LEVEL_COLORS)
+
+
 def _color_for(level: int) -> str:
-    for threshold in sorted(_LEVEL_COLORS.keys(), reverse=True):
-        if level >= threshold:
-            return _LEVEL_COLORS[threshold]
-    return "#d4d4d4"
+    color = _COLOR_CACHE.get(level)
+    if color is None:
+        color = "#d4d4d4"
+        for threshold in sorted(_LEVEL_COLORS.keys(), reverse=True):
+            if level >= threshold:
+                color = _LEVEL_COLORS[threshold]
+                break
+        _COLOR_CACHE[level] = color
+    return color
+
+
+_FORMATTER = logging.Formatter(
+    "%(asctime)s  %(levelname)-8s  %(name)s  %(message)s",
+    datefmt="%H:%M:%S",
+)
+# Where %(levelname)-8s lands in a formatted line ("HH:MM:SS  LEVEL   …")
+_LEVEL_SLICE = slice(10, 18)
+
+
+class _LevelHighlighter(QSyntaxHighlighter):
+    """Colour each log line by the level name at its fixed column.
+
+    Continuation lines (e.g. tracebacks) carry no level and inherit the
+    colour of the line above through the block state.
+    """
+
+    def __init__(self, document) -> None:
+        super().__init__(document)
+        self._formats: dict[int, QTextCharFormat] = {}
+
+    def _format_for(self, level: int) -> QTextCharFormat:
+        fmt = self._formats.get(level)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(_color_for(level)))
+            self._formats[level] = fmt
+        return fmt
+
+    def highlightBlock(self, text: str) -> None:  # type: ignore[override]
+        level = logging.getLevelName(text[_LEVEL_SLICE].strip()) if len(text) > 10 else None
+        if not isinstance(level, int):
+            level = max(self.previousBlockState(), logging.INFO)
+        self.setCurrentBlockState(level)
+        self.setFormat(0, len(text), self._format_for(level))
 
 
 # ---------------------------------------------------------------------------
@@ -120,7 +168,12 @@ class LogViewerDialog(QDialog):
 
         self._filter_edit = QLineEdit()
         self._filter_edit.setPlaceholderText("Filter… (case-insensitive substring)")
-        self._filter_edit.textChanged.connect(self._apply_filter)
+        # Re-filter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._filter_edit.textChanged.connect(self._filter_timer.start)
         toolbar.addWidget(QLabel("Filter:"))
         toolbar.addWidget(self._filter_edit, stretch=1)
 
@@ -139,14 +192,17 @@ class LogViewerDialog(QDialog):
         layout.addLayout(toolbar)
 
         # ---- text area ----
-        self._text = QTextEdit()
+        self._text = QPlainTextEdit()
         self._text.setReadOnly(True)
+        # The widget trims its own oldest lines once this many are shown
+        self._text.setMaximumBlockCount(self._MAX_LINES)
         font = QFont("Consolas", 9)
         font.setStyleHint(QFont.StyleHint.Monospace)
         self._text.setFont(font)
         self._text.setStyleSheet(
-            "QTextEdit { background-color: #1e1e1e; color: #d4d4d4; border: none; }"
+            "QPlainTextEdit { background-color: #1e1e1e; color: #d4d4d4; border: none; }"
         )
+        self._highlighter = _LevelHighlighter(self._text.document())
         layout.addWidget(self._text, stretch=1)
 
         # ---- bottom row ----
@@ -161,26 +217,21 @@ class LogViewerDialog(QDialog):
         layout.addLayout(bottom)
 
         # internal state
-        self._all_lines: list[tuple[int, str]] = []   # (level, formatted_text)
+        # (level, formatted_text) — the source for re-filtering, since the view
+        # only holds the lines that pass the current filter
+        self._all_lines: collections.deque[tuple[int, str]] = collections.deque(
+            maxlen=self._MAX_LINES
+        )
         self._entry_count = 0
+        self._filter_text = ""   # lower-cased filter, refreshed by _apply_filter
 
     # ------------------------------------------------------------------ slots
 
     @Slot(logging.LogRecord)
     def _on_record(self, record: logging.LogRecord) -> None:
-        formatter = logging.Formatter(
-            "%(asctime)s  %(levelname)-8s  %(name)s  %(message)s",
-            datefmt="%H:%M:%S",
-        )
-        text = formatter.format(record)
+        text = _FORMATTER.format(record)
         self._all_lines.append((record.levelno, text))
-
-        # Trim buffer
-        if len(self._all_lines) > self._MAX_LINES:
-            self._all_lines = self._all_lines[-self._MAX_LINES :]
-            self._rebuild()
-        else:
-            self._append_line(record.levelno, text)
+        self._append_line(record.levelno, text)
 
         self._entry_count += 1
         self._count_label.setText(f"{self._entry_count} entries")
@@ -191,28 +242,30 @@ class LogViewerDialog(QDialog):
     # ------------------------------------------------------------------ helpers
 
     def _passes_filter(self, text: str) -> bool:
-        f = self._filter_edit.text().strip().lower()
+        f = self._filter_text
         return (not f) or (f in text.lower())
 
     def _append_line(self, level: int, text: str) -> None:
+        # Colour comes from _LevelHighlighter, so the level is not needed here
         if not self._passes_filter(text):
             return
-        color = _color_for(level)
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(color))
-        cursor = self._text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        if not self._text.toPlainText() == "":
-            cursor.insertText("\n")
-        cursor.insertText(text, fmt)
+        self._text.appendPlainText(text)
 
     def _rebuild(self) -> None:
-        """Re-render the text area (used after filter change or buffer trim)."""
-        self._text.clear()
-        for level, text in self._all_lines:
-            self._append_line(level, text)
+        """Re-render the text area in one setPlainText (used after a filter change)."""
+        joined = "\n".join(text for _, text in self._all_lines if self._passes_filter(text))
+        self._text.setUpdatesEnabled(False)
+        self._text.blockSignals(True)
+        try:
+            self._text.setPlainText(joined)
+        finally:
+            self._text.blockSignals(False)
+            self._text.setUpdatesEnabled(True)
+        if self._auto_scroll.isChecked():
+            self._text.moveCursor(QTextCursor.MoveOperation.End)
 
-    def _apply_filter(self, _: str) -> None:
+    def _apply_filter(self) -> None:
+        self._filter_text = self._filter_edit.text().strip().lower()
         self._rebuild()
 
     def _copy_all(self) -> None:
@@ -27,6 +27,9 @@ class VideoPlayer(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Label is only re-rendered when the displayed second changes
+        self._duration_text = _ms_to_hms(0)
+        self._last_label_s  = -1
         self._build_ui()
         self._connect_signals()
 
@@ -96,9 +99,13 @@ class VideoPlayer(QWidget):
     def _on_position_changed(self, pos_ms: int) -> None:
         if not self.position_slider.isSliderDown():
             self.position_slider.setValue(pos_ms)
-        dur = self.player.duration()
-        self.time_label.setText(f"{_ms_to_hms(pos_ms)} / {_ms_to_hms(dur)}")
+        pos_s = pos_ms // 1000
+        if pos_s != self._last_label_s:
+            self._last_label_s = pos_s
+            self.time_label.setText(f"{_ms_to_hms(pos_ms)} / {self._duration_text}")
 
     @Slot(int)
     def _on_duration_changed(self, dur_ms: int) -> None:
         self.position_slider.setRange(0, dur_ms)
+        self._duration_text = _ms_to_hms(dur_ms)
+        self._last_label_s  = -1
@@ -0,0 +1,54 @@
+"""QThread worker: decode a video's audio track to 16 kHz mono float32."""
+from __future__ import annotations
+
+import logging
+import traceback
+
+from PySide6.QtCore import QObject, Signal
+
+logger = logging.getLogger(__name__)
+
+# Whisper's native input format
+SAMPLE_RATE = 16_000
+
+
+class AudioDecodeWorker(QObject):
+    """Decode and resample the audio track once, right after a video is loaded.
+
+    The resulting ``np.float32`` buffer is handed to the transcription
+    worker, which then skips its own decode/resample pass.
+
+    Signals
+    -------
+    audio_ready(str, object):   (video path, np.ndarray of samples).
+    error(str):                 emitted on exception.
+    finished():                 always emitted at the end.
+    """
+
+    audio_ready = Signal(str, object)
+    error       = Signal(str)
+    finished    = Signal()
+
+    def __init__(self, video_path: str):
+        super().__init__()
+        self._video_path = video_path
+
+    # ------------------------------------------------------------------ slot
+    def run(self) -> None:
+        logger.info("AudioDecodeWorker starting — %s", self._video_path)
+        try:
+            from faster_whisper import decode_audio
+
+            audio = decode_audio(self._video_path, sampling_rate=SAMPLE_RATE)
+            logger.info(
+                "AudioDecodeWorker done — %.1f s of audio (%.1f MB)",
+                len(audio) / SAMPLE_RATE, audio.nbytes / 1e6,
+            )
+            self.audio_ready.emit(self._video_path, audio)
+
+        except Exception as exc:
+            logger.warning("AudioDecodeWorker failed: %s", exc)
+            logger.debug(traceback.format_exc())
+            self.error.emit(str(exc))
+        finally:
+            self.finished.emit()
@@ -2,7 +2,7 @@
 
 Pipeline per video
 ------------------
-  1. Transcribe (Whisper)
+  1. Transcribe (faster-whisper)
   2. Translate each caption → Khmer (googletrans)
   3. Generate TTS audio per caption (edge-tts)
   4. Export dubbed video  →  <output_dir>/<stem>_dubbed.mp4
@@ -12,7 +12,6 @@ Failed videos are logged and skipped; processing continues with the next file.
 from __future__ import annotations
 
 import asyncio
-import importlib.util
 import logging
 import os
 import sys
@@ -24,14 +23,16 @@ from typing import List
 from PySide6.QtCore import QObject, Signal
 
 from app.models.caption import Caption
+from app.utils import model_registry
 from app.utils.ffmpeg_utils import export_video
 from app.utils.srt_utils import write_srt
 from app.workers.tts_worker import DEFAULT_VOICE
+from libs.googletrans.main import translate_texts
 
 logger = logging.getLogger(__name__)
 
 # Video extensions accepted for batch processing
-VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".webm", ".flv", ".wmv"}
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mkv", ".avi", ".mov", ".webm", ".flv", ".wmv"})
 
 # ---- lazy-load libraries that are not importable by standard name ----
 
@@ -41,14 +42,6 @@ _WHISPER_LIB = os.path.normpath(
 if _WHISPER_LIB not in sys.path:
     sys.path.insert(0, _WHISPER_LIB)
 
-_TRANS_MAIN = os.path.normpath(
-    os.path.join(os.path.dirname(__file__), "..", "..", "libs", "googletrans", "main.py")
-)
-_spec = importlib.util.spec_from_file_location("googletrans_main", _TRANS_MAIN)
-_googletrans_main = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_googletrans_main)
-translate_text = _googletrans_main.translate_text
-
 
 def collect_videos(folder: str) -> List[str]:
     """Return sorted list of video file paths inside *folder* (non-recursive)."""
@@ -87,6 +80,9 @@ class BatchWorker(QObject):
     # Translation retry settings (mirrors TranslateWorker)
     _MAX_RETRIES = 3
     _RETRY_DELAY = 2.0
+    _TRANSLATE_BATCH = 16   # captions per translation request
+    _TTS_CONCURRENCY = 8    # Edge TTS requests in flight at once
+    _TTS_RETRIES     = 5
 
     def __init__(
         self,
@@ -95,6 +91,7 @@ class BatchWorker(QObject):
         model_name: str = "auto",
         language: str = "zh",
         voice: str = DEFAULT_VOICE,
+        batch_size: int = 8,
     ):
         super().__init__()
         self._video_paths = video_paths
@@ -102,6 +99,7 @@ class BatchWorker(QObject):
         self._model_name  = model_name
         self._language    = language
         self._voice       = voice
+        self._batch_size  = batch_size
         self._cancelled   = False
 
     # ------------------------------------------------------------------ public
@@ -124,8 +122,13 @@ class BatchWorker(QObject):
         whisper_model = None
         try:
             self.video_step.emit("Loading Whisper model…")
+            from faster_whisper import BatchedInferencePipeline
             from main import load_model  # from libs/whisper/main.py
-            whisper_model, device = load_model(self._model_name)
+            model, device = model_registry.get(
+                "whisper", (self._model_name, "auto"),
+                lambda: load_model(self._model_name),
+            )
+            whisper_model = BatchedInferencePipeline(model=model)
             logger.info("Whisper model loaded on device=%s", device)
         except Exception as exc:
             logger.error("Failed to load Whisper model: %s", exc)
@@ -169,6 +172,43 @@ class BatchWorker(QObject):
         """Clamp and emit video-level progress."""
         self.video_progress.emit(max(0, min(100, overall_pct)))
 
+    async def _synthesize_all(
+        self, edge_tts, captions: List[Caption], tts_dir: str, idx: int, total: int,
+    ) -> None:
+        """Generate the TTS file of every caption with text, concurrently."""
+        sem = asyncio.Semaphore(self._TTS_CONCURRENCY)
+        tts_total = len(captions) or 1
+        done = sum(1 for cap in captions if not cap.khmer_text)
+        prefix = os.path.join(tts_dir, "tts_")
+        default_voice = self._voice
+
+        async def one(cap: Caption) -> None:
+            nonlocal done
+            out_path = f"{prefix}{cap.index:04d}.mp3"
+            voice    = cap.voice or default_voice
+            async with sem:
+                for attempt in range(self._TTS_RETRIES):
+                    if self._cancelled:
+                        raise InterruptedError("Cancelled")
+                    try:
+                        communicate = edge_tts.Communicate(text=cap.khmer_text, voice=voice)
+                        await communicate.save(out_path)
+                        break
+                    except Exception as exc:
+                        logger.warning(
+                            "[%d/%d] TTS attempt %d/%d failed for caption %d: %s",
+                            idx, total, attempt + 1, self._TTS_RETRIES, cap.index, exc,
+                        )
+                        if attempt == self._TTS_RETRIES - 1:
+                            raise
+                        await asyncio.sleep(2 ** attempt)
+            cap.tts_audio_path = out_path
+            done += 1
+            # Progress: 55 → 75
+            self._emit_progress(55 + int(done / tts_total * 20))
+
+        await asyncio.gather(*(one(cap) for cap in captions if cap.khmer_text))
+
     def _process_one(
         self,
         idx: int,
@@ -186,20 +226,21 @@ class BatchWorker(QObject):
             self.video_step.emit("Transcribing…")
             self._emit_progress(5)
 
-            result   = whisper_model.transcribe(
+            segments, _info = whisper_model.transcribe(
                 video_path,
                 language=self._language,
-                verbose=False,
+                batch_size=self._batch_size,
+                beam_size=5,
+                vad_filter=True,
+                without_timestamps=False,
                 word_timestamps=False,
-                fp16=False,   # safe default; GPU transcription still works
             )
-            segments = result.get("segments", [])
             captions: List[Caption] = [
                 Caption(
                     index=i,
-                    start=float(s["start"]),
-                    end=float(s["end"]),
-                    original_text=s["text"].strip(),
+                    start=float(s.start),
+                    end=float(s.end),
+                    original_text=s.text.strip(),
                 )
                 for i, s in enumerate(segments, start=1)
             ]
@@ -215,32 +256,34 @@ class BatchWorker(QObject):
             self.video_step.emit("Translating to Khmer…")
 
             cap_total = len(captions) or 1
-            for ci, cap in enumerate(captions):
+            for start in range(0, len(captions), self._TRANSLATE_BATCH):
                 if self._cancelled:
                     raise InterruptedError("Cancelled")
-                translated = None
+                batch = captions[start:start + self._TRANSLATE_BATCH]
+                texts = [cap.original_text for cap in batch]
+                results = [None] * len(batch)
                 for attempt in range(1, self._MAX_RETRIES + 1):
                     try:
-                        result_txt = translate_text(cap.original_text, target_language="km")
-                        if result_txt:
-                            translated = result_txt
-                            break
+                        results = translate_texts(texts, target_language="km")
+                        break
                     except Exception as exc:
                         logger.warning(
-                            "[%d/%d] Translation attempt %d/%d failed for caption %d: %s",
-                            idx, total, attempt, self._MAX_RETRIES, cap.index, exc,
+                            "[%d/%d] Translation attempt %d/%d failed for captions %d–%d: %s",
+                            idx, total, attempt, self._MAX_RETRIES,
+                            batch[0].index, batch[-1].index, exc,
                         )
                         if attempt < self._MAX_RETRIES:
                             time.sleep(self._RETRY_DELAY)
-                if translated:
-                    cap.khmer_text = translated
-                else:
-                    logger.warning(
-                        "[%d/%d] Caption %d skipped (all translation attempts failed)",
-                        idx, total, cap.index,
-                    )
+                for cap, translated in zip(batch, results):
+                    if translated:
+                        cap.khmer_text = translated
+                    else:
+                        logger.warning(
+                            "[%d/%d] Caption %d skipped (all translation attempts failed)",
+                            idx, total, cap.index,
+                        )
                 # Progress: 25 → 55 across translation
-                self._emit_progress(25 + int((ci + 1) / cap_total * 30))
+                self._emit_progress(25 + int((start + len(batch)) / cap_total * 30))
 
             logger.info("[%d/%d] Translation done for %s", idx, total, video_name)
 
@@ -251,37 +294,9 @@ class BatchWorker(QObject):
 
             import edge_tts
 
-            tts_total = len(captions) or 1
-            for ti, cap in enumerate(captions):
-                if self._cancelled:
-                    raise InterruptedError("Cancelled")
-                if not cap.khmer_text:
-                    self._emit_progress(55 + int((ti + 1) / tts_total * 20))
-                    continue
-
-                out_path = os.path.join(tts_dir, f"tts_{cap.index:04d}.mp3")
-                voice    = cap.voice or self._voice
-                max_tts_retries = 5
-                for attempt in range(max_tts_retries):
-                    try:
-                        communicate = edge_tts.Communicate(text=cap.khmer_text, voice=voice)
-                        asyncio.run(communicate.save(out_path))
-                        break
-                    except Exception as exc:
-                        logger.warning(
-                            "[%d/%d] TTS attempt %d/%d failed for caption %d: %s",
-                            idx, total, attempt + 1, max_tts_retries, cap.index, exc,
-                        )
-                        if attempt == max_tts_retries - 1:
-                            raise
-                        time.sleep(2 ** attempt)
-
-                cap.tts_audio_path = out_path
-                # Progress: 55 → 75
-                self._emit_progress(55 + int((ti + 1) / tts_total * 20))
-
-                if ti < len(captions) - 1:
-                    time.sleep(0.3)
+            # One event loop for the whole video; the semaphore bounds how
+            # many requests are in flight instead of a fixed pause between them
+            asyncio.run(self._synthesize_all(edge_tts, captions, tts_dir, idx, total))
 
             logger.info("[%d/%d] TTS done for %s", idx, total, video_name)
 
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 import traceback
-from typing import List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
 
 from PySide6.QtCore import QObject, Signal
 
@@ -14,6 +16,9 @@ from app.utils.srt_utils import write_srt
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between progress signals sent to the UI thread
+_PROGRESS_INTERVAL_S = 0.05
+
 
 class ExportWorker(QObject):
     """Render the final video + SRT file.
@@ -51,11 +56,25 @@ class ExportWorker(QObject):
         self._original_volume      = original_volume
         self._mute_during_captions = mute_during_captions
         self._cancelled            = False
+        self._last_progress        = (-1, 0.0)     # (value, monotonic time)
+        self._srt_future: Optional[Future] = None
 
     def cancel(self) -> None:
         """Request cancellation. The worker will stop at the next safe checkpoint."""
         logger.info("ExportWorker cancel requested")
         self._cancelled = True
+        if self._srt_future is not None:
+            self._srt_future.cancel()
+
+    def _on_export_progress(self, pct: int) -> None:
+        """Forward ffmpeg progress, dropping repeats and updates closer than 50 ms."""
+        value = 5 + int(pct * 0.95)
+        last_value, last_time = self._last_progress
+        now = time.monotonic()
+        if value == last_value or (now - last_time < _PROGRESS_INTERVAL_S and value < 100):
+            return
+        self._last_progress = (value, now)
+        self.progress.emit(value)
 
     # ------------------------------------------------------------------ slot
     def run(self) -> None:
@@ -65,27 +84,33 @@ class ExportWorker(QObject):
                 logger.info("ExportWorker: cancelled before start")
                 return
 
-            # 1. Write SRT
+            # 1. Write SRT — independent of the render, so it runs alongside it
             srt_path = os.path.splitext(self._output_video_path)[0] + ".srt"
             logger.info("Writing SRT to %s", srt_path)
-            write_srt(self._captions, srt_path, use_khmer=True)
-            self.progress.emit(5)
-
-            if self._cancelled:
-                logger.info("ExportWorker: cancelled before ffmpeg")
-                return
-
-            # 2. Render video
-            logger.info("Running ffmpeg export (volume=%.2f, mute=%s)…",
-                        self._original_volume, self._mute_during_captions)
-            export_video(
-                video_path=self._video_path,
-                captions=self._captions,
-                output_video_path=self._output_video_path,
-                original_volume=self._original_volume,
-                mute_during_captions=self._mute_during_captions,
-                progress_callback=lambda pct: self.progress.emit(5 + int(pct * 0.95)),
-            )
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="srt-write") as pool:
+                self._srt_future = pool.submit(write_srt, self._captions, srt_path, True)
+                self.progress.emit(5)
+
+                if self._cancelled:
+                    logger.info("ExportWorker: cancelled before ffmpeg")
+                    return
+
+                # 2. Render video
+                logger.info("Running ffmpeg export (volume=%.2f, mute=%s)…",
+                            self._original_volume, self._mute_during_captions)
+                export_video(
+                    video_path=self._video_path,
+                    captions=self._captions,
+                    output_video_path=self._output_video_path,
+                    original_volume=self._original_volume,
+                    mute_during_captions=self._mute_during_captions,
+                    progress_callback=self._on_export_progress,
+                )
+
+                if self._srt_future.cancelled():
+                    logger.info("ExportWorker: cancelled before the SRT was written")
+                    return
+                self._srt_future.result()   # re-raise a failed SRT write
 
             logger.info("ExportWorker done — %s", self._output_video_path)
             self.done.emit(self._output_video_path)
@@ -0,0 +1,25 @@
+"""Run QObject workers on a shared QThreadPool instead of a QThread each."""
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, QRunnable
+
+
+class WorkerRunnable(QRunnable):
+    """Adapter that calls a worker's ``run()`` on a pool thread.
+
+    The worker keeps its own signals and stays owned by the GUI thread, so
+    every emission from the pool thread reaches GUI slots as a queued
+    connection — exactly as with the previous ``moveToThread`` setup.
+
+    Usage
+    -----
+    QThreadPool.globalInstance().start(WorkerRunnable(worker))
+    """
+
+    def __init__(self, worker: QObject) -> None:
+        super().__init__()
+        self._worker = worker
+        self.setAutoDelete(True)
+
+    def run(self) -> None:
+        self._worker.run()
@@ -1,15 +1,24 @@
-"""QThread worker: transcribe a video file using openai-whisper."""
+"""QThread worker: transcribe a video file using faster-whisper (CTranslate2)."""
 from __future__ import annotations
 
 import logging
 import os
+import queue
 import sys
+import threading
+import time
 import traceback
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, List
 
 from PySide6.QtCore import QObject, QThread, Signal
 
 from app.models.caption import Caption
+from app.utils import model_registry
+from app.workers.audio_worker import SAMPLE_RATE
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +29,14 @@ _WHISPER_LIB = os.path.normpath(
 if _WHISPER_LIB not in sys.path:
     sys.path.insert(0, _WHISPER_LIB)
 
+# Imported with the module (MainWindow warms worker modules up on idle), not
+# on the first click; a missing helper is reported when a run starts
+try:
+    from main import load_model  # from libs/whisper/main.py
+except ImportError as _exc:
+    logger.warning("Whisper helpers unavailable: %s", _exc)
+    load_model = None
+
 
 class TranscribeWorker(QObject):
     """Run Whisper transcription in a background thread.
@@ -27,22 +44,43 @@ class TranscribeWorker(QObject):
     Signals
     -------
     progress(int):          0–100 percent estimate (segment-based).
-    captions_ready(list):   emitted when transcription is complete.
+    caption_partial(list):  newly decoded captions, emitted while the
+                            transcription is still running.
+    captions_ready(tuple):  emitted when transcription is complete.
     error(str):             emitted on exception.
     finished():             always emitted at the end.
     """
 
-    progress       = Signal(int)
-    captions_ready = Signal(list)
-    error          = Signal(str)
-    finished       = Signal()
+    # Minimum time between two caption_partial emissions (seconds)
+    PARTIAL_INTERVAL = 0.5
+    # Minimum time between two progress emissions (seconds, ~30 Hz)
+    PROGRESS_INTERVAL = 0.033
+    # Audio shorter than this (seconds) is never split across GPUs
+    MULTI_GPU_MIN_DURATION = 600
+
+    progress        = Signal(int)
+    caption_partial = Signal(list)
+    captions_ready  = Signal(object)   # tuple, handed over without a copy
+    error           = Signal(str)
+    finished        = Signal()
 
-    def __init__(self, video_path: str, model_name: str = "auto", language: str = "zh"):
+    def __init__(
+        self,
+        video_path: str,
+        audio: np.ndarray | None = None,
+        model_name: str = "auto",
+        language: str = "zh",
+        compute_type: str = "auto",
+        batch_size: int = 8,
+    ):
         super().__init__()
-        self._video_path  = video_path
-        self._model_name  = model_name
-        self._language    = language
-        self._cancelled   = False
+        self._video_path   = video_path
+        self._audio        = audio          # pre-decoded 16 kHz mono samples, if available
+        self._model_name   = model_name
+        self._language     = language
+        self._compute_type = compute_type   # "auto" → int8_float16 on CUDA, int8 on CPU
+        self._batch_size   = batch_size     # VAD chunks decoded per batch
+        self._cancelled    = False
 
     def cancel(self) -> None:
         """Request cancellation. The worker will stop at the next safe checkpoint."""
@@ -52,54 +90,203 @@ class TranscribeWorker(QObject):
     # ------------------------------------------------------------------ slot
     def run(self) -> None:
         logger.info("TranscribeWorker starting — video=%s  model=%s", self._video_path, self._model_name)
+        decoder = None
+        piece_segments = None
         try:
-            from main import load_model  # from libs/whisper/main.py
+            from faster_whisper import BatchedInferencePipeline, decode_audio
+
+            if load_model is None:
+                raise RuntimeError("libs/whisper/main.py could not be imported")
 
             self.progress.emit(5)
-            logger.info("Loading Whisper model '%s'…", self._model_name)
-            model, device = load_model(self._model_name)
-            logger.info("Whisper model loaded on device=%s", device)
+            # Without a pre-decoded buffer, decode the audio (ffmpeg) while the
+            # model loads instead of after it
+            if self._audio is None:
+                decoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-decode")
+                audio_future = decoder.submit(decode_audio, self._video_path, sampling_rate=SAMPLE_RATE)
+            logger.info("Loading Whisper model '%s' (compute_type=%s)…", self._model_name, self._compute_type)
+            # Kept loaded between runs; re-transcribing with the same model is instant
+            model, device = model_registry.get(
+                "whisper",
+                (self._model_name, self._compute_type),
+                lambda: load_model(self._model_name, compute_type=self._compute_type),
+            )
+            logger.info("Whisper model ready on device=%s", device)
             self.progress.emit(20)
 
             if self._cancelled:
                 logger.info("TranscribeWorker: cancelled before transcription")
                 return
 
-            logger.info("Transcribing audio track…")
-            result = model.transcribe(
-                self._video_path,
-                language=self._language,
-                verbose=False,
-                word_timestamps=False,
-                fp16=(device == "cuda"),
+            logger.info(
+                "Transcribing audio track (batch_size=%d, pre-decoded=%s)…",
+                self._batch_size, decoder is None,
             )
+            if decoder is not None:
+                self._audio = audio_future.result()
 
-            segments = result.get("segments", [])
-            total    = len(segments) or 1
-            logger.info("Transcription produced %d segments", len(segments))
+            # The batched pipeline splits the audio into VAD chunks and decodes
+            # `batch_size` of them at once.  `segments` is still a lazy
+            # generator, yielded batch by batch in timeline order, so progress
+            # is derived from each segment's end time.
+            duration = len(self._audio) / SAMPLE_RATE or 1.0
+            replicas = model.model.device_index
+            pieces = []
+            if len(replicas) > 1 and duration >= self.MULTI_GPU_MIN_DURATION:
+                # One piece per GPU replica, transcribed concurrently
+                pieces = _split_clips(self._audio, len(replicas))
+            if len(pieces) > 1:
+                logger.info("Transcribing %d pieces in parallel on GPUs %s", len(pieces), replicas)
+                segments = piece_segments = self._transcribe_pieces(BatchedInferencePipeline, model, pieces)
+            else:
+                segments, _ = self._transcribe(BatchedInferencePipeline(model=model), self._audio)
             captions: List[Caption] = []
 
+            # Segments leave the generator only once decoded, so they are final
+            # and can be shown straight away.  They are forwarded in small
+            # groups to keep the number of cross-thread signals low.
+            pending: List[Caption] = []
+            last_flush = time.monotonic()
+            last_pct, last_pct_t = -1, 0.0
+            pct_per_second = 75.0 / duration
+
             for i, seg in enumerate(segments, start=1):
                 if self._cancelled:
                     logger.info("TranscribeWorker: cancelled during segment processing")
                     return
-                captions.append(
-                    Caption(
-                        index=i,
-                        start=float(seg["start"]),
-                        end=float(seg["end"]),
-                        original_text=seg["text"].strip(),
-                    )
+                cap = Caption(
+                    index=i,
+                    start=float(seg.start),
+                    end=float(seg.end),
+                    original_text=seg.text.strip(),
                 )
-                self.progress.emit(20 + int(i / total * 75))
+                captions.append(cap)
+                pending.append(cap)
+                now = time.monotonic()
+                if now - last_flush >= self.PARTIAL_INTERVAL:
+                    self.caption_partial.emit(pending)
+                    pending = []
+                    last_flush = now
+                pct = 20 + int(min(seg.end * pct_per_second, 75.0))
+                if pct != last_pct and now - last_pct_t >= self.PROGRESS_INTERVAL:
+                    self.progress.emit(pct)
+                    last_pct, last_pct_t = pct, now
 
+            if pending:
+                self.caption_partial.emit(pending)
+
+            logger.info("Transcription produced %d segments", len(captions))
             self.progress.emit(100)
             logger.info("TranscribeWorker done — %d captions", len(captions))
-            self.captions_ready.emit(captions)
+            # A tuple the GUI cannot mutate; the worker drops its own list
+            self.captions_ready.emit(tuple(captions))
+            captions.clear()
 
         except Exception as exc:
             logger.error("TranscribeWorker failed: %s", exc)
             logger.debug(traceback.format_exc())
             self.error.emit(str(exc))
         finally:
+            if decoder is not None:
+                decoder.shutdown(wait=False, cancel_futures=True)
+            if piece_segments is not None:
+                piece_segments.close()   # joins the piece threads
             self.finished.emit()
+
+    # ------------------------------------------------------------------ private
+    def _transcribe(self, pipeline, audio: np.ndarray, clip_timestamps=None):
+        # With clip_timestamps the pipeline skips its own VAD pass
+        return pipeline.transcribe(
+            audio,
+            language=self._language,
+            batch_size=self._batch_size,
+            beam_size=5,
+            vad_filter=clip_timestamps is None,
+            clip_timestamps=clip_timestamps,
+            without_timestamps=False,
+            word_timestamps=False,
+        )
+
+    def _transcribe_pieces(self, pipeline_cls, model, pieces: List[List[dict]]) -> Iterator:
+        """Transcribe *pieces* concurrently and yield their segments in order.
+
+        Each piece (a list of clip timestamps over the whole audio) runs on
+        its own pool thread; CTranslate2 dispatches the concurrent requests
+        to different GPU replicas.  Segments of the earliest unfinished
+        piece are yielded as soon as they are decoded, later pieces are
+        buffered until their turn.  Closing the generator stops the pieces
+        and waits for their threads.
+        """
+        queues: List[queue.Queue] = [queue.Queue() for _ in pieces]
+        done = object()
+        stop = threading.Event()
+
+        def work(clips: List[dict], out: queue.Queue) -> None:
+            try:
+                segments, _ = self._transcribe(pipeline_cls(model=model), self._audio, clips)
+                for seg in segments:
+                    if stop.is_set() or self._cancelled:
+                        break
+                    out.put(seg)
+            except Exception as exc:
+                out.put(exc)
+            finally:
+                out.put(done)
+
+        executor = ThreadPoolExecutor(max_workers=len(pieces), thread_name_prefix="whisper")
+        try:
+            for clips, out in zip(pieces, queues):
+                executor.submit(work, clips, out)
+            for out in queues:
+                while (item := out.get()) is not done:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+        finally:
+            # Stop the other pieces at their next segment and wait for them,
+            # so nothing is still decoding once run() returns
+            stop.set()
+            executor.shutdown(wait=True)
+
+
+# Longest clip Whisper decodes in one window, and the longest pause bridged
+# when adjacent speech regions are merged into one clip (seconds)
+_CLIP_MAX_S = 30
+_CLIP_MAX_GAP_S = 2.0
+
+
+def _split_clips(audio: np.ndarray, parts: int) -> List[List[dict]]:
+    """Split the speech in *audio* into up to *parts* pieces of similar length.
+
+    One VAD pass (with the batched pipeline's own settings) finds the
+    speech; adjacent regions are merged into contiguous clips of at most
+    30 s, and the clips are dealt out in timeline order.  Every piece is a
+    list of ``{"start", "end"}`` clip timestamps in seconds over the whole
+    audio, so segment times need no shifting and no utterance straddles
+    two pieces.
+    """
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    speech = get_speech_timestamps(
+        audio, VadOptions(max_speech_duration_s=_CLIP_MAX_S, min_silence_duration_ms=160),
+    )
+    clips: List[List[int]] = []
+    for region in speech:
+        if (
+            clips
+            and region["start"] - clips[-1][1] <= _CLIP_MAX_GAP_S * SAMPLE_RATE
+            and region["end"] - clips[-1][0] <= _CLIP_MAX_S * SAMPLE_RATE
+        ):
+            clips[-1][1] = region["end"]
+        else:
+            clips.append([region["start"], region["end"]])
+
+    total = sum(end - start for start, end in clips) or 1
+    pieces: List[List[dict]] = [[]]
+    covered = 0
+    for start, end in clips:
+        if len(pieces) < parts and covered >= total * len(pieces) / parts:
+            pieces.append([])
+        pieces[-1].append({"start": start / SAMPLE_RATE, "end": end / SAMPLE_RATE})
+        covered += end - start
+    return [piece for piece in pieces if piece]
@@ -4,30 +4,36 @@ from __future__ import annotations
 import importlib.util
 import logging
 import os
-import sys
 import time
 import traceback
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List
 
 from PySide6.QtCore import QObject, Signal
 
 from app.models.caption import Caption
+from app.utils import cache_utils, model_registry
+from libs.googletrans.main import translate_texts
+from libs.nmt import main as nmt
 
 logger = logging.getLogger(__name__)
 
-# Load libs/googletrans/main.py directly to avoid name clash with libs/whisper/main.py
-_TRANS_MAIN = os.path.normpath(
-    os.path.join(os.path.dirname(__file__), "..", "..", "libs", "googletrans", "main.py")
-)
-_spec = importlib.util.spec_from_file_location("googletrans_main", _TRANS_MAIN)
-_googletrans_main = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_googletrans_main)
-translate_text = _googletrans_main.translate_text
+TARGET_LANGUAGE = "km"
 
 
 class TranslateWorker(QObject):
     """Translate each caption's original_text to Khmer in a background thread.
 
+    Captions with identical text are translated once; the distinct texts
+    are sent in batches of ``BATCH_SIZE`` (one request per batch, up to
+    ``MAX_WORKERS`` at once) and results are still reported per caption,
+    in completion order.
+
+    When ``$KHMER_DUBBER_NMT_MODEL`` points at a CTranslate2 NLLB-200 model,
+    texts are translated locally in batches of ``NMT_BATCH_SIZE`` instead
+    of through googletrans; if that model cannot be loaded the worker falls
+    back to googletrans.
+
     Signals
     -------
     progress(int):           0–100 percent.
@@ -38,6 +44,9 @@ class TranslateWorker(QObject):
 
     MAX_RETRIES  = 3
     RETRY_DELAY  = 2.0   # seconds between retries
+    BATCH_SIZE   = 16    # captions per translation request
+    MAX_WORKERS  = 4     # translation requests in flight at once
+    NMT_BATCH_SIZE = 64  # captions per forward pass of the local model
 
     progress           = Signal(int)
     caption_translated = Signal(int, str)   # (caption index, translated text)
@@ -45,10 +54,30 @@ class TranslateWorker(QObject):
     error              = Signal(str)
     finished           = Signal()
 
-    def __init__(self, captions: List[Caption]):
+    def __init__(self, captions: List[Caption], source_language: str = "zh"):
         super().__init__()
-        self._captions  = captions
-        self._cancelled = False
+        self._captions        = captions
+        self._source_language = source_language   # Whisper code; only the local model needs it
+        self._nmt             = None              # local NLLB model, loaded in run()
+        self._cancelled       = False
+
+    @staticmethod
+    def backend_for(source_language: str) -> str:
+        """Name the backend a run would use, for keying cached translations.
+
+        ``"googletrans"``, or ``"nllb-<source language>-<model hash>"`` when
+        the local model is configured and installed.
+        """
+        model_dir = nmt.model_dir_from_env()
+        if (
+            model_dir is None
+            or not os.path.isdir(model_dir)
+            or source_language not in nmt.NLLB_CODES
+            or not all(importlib.util.find_spec(m) for m in ("ctranslate2", "sentencepiece"))
+        ):
+            return "googletrans"
+        model_key = cache_utils.texts_key([os.path.abspath(model_dir)])[:8]
+        return f"nllb-{source_language}-{model_key}"
 
     def cancel(self) -> None:
         """Request cancellation. The worker will stop at the next safe checkpoint."""
@@ -58,43 +87,75 @@ class TranslateWorker(QObject):
     # ------------------------------------------------------------------ slot
     def run(self) -> None:
         logger.info("TranslateWorker starting — %d captions", len(self._captions))
+        phrases: Dict[str, str] = {}
+        phrase_key: str | None = None
+        learned = 0
         try:
             total = len(self._captions) or 1
-
-            for i, cap in enumerate(self._captions):
-                if self._cancelled:
-                    logger.info("TranslateWorker: cancelled at caption %d", i)
-                    return
-                translated = None
-                last_exc: Exception | None = None
-
-                for attempt in range(1, self.MAX_RETRIES + 1):
-                    try:
-                        result = translate_text(cap.original_text, target_language="km")
-                        if result:
-                            translated = result
-                            break
-                    except Exception as exc:
-                        last_exc = exc
-                        logger.warning(
-                            "Translation attempt %d/%d failed for caption %d: %s",
-                            attempt, self.MAX_RETRIES, cap.index, exc,
-                        )
-                        if attempt < self.MAX_RETRIES:
-                            time.sleep(self.RETRY_DELAY)
-
-                if translated:
-                    self.caption_translated.emit(cap.index, translated)
+            done  = 0
+
+            # Repeated lines (names, stock phrases) share one translation
+            by_text: Dict[str, List[Caption]] = {}
+            for cap in self._captions:
+                by_text.setdefault(cap.original_text, []).append(cap)
+            if len(by_text) < len(self._captions):
+                logger.info(
+                    "TranslateWorker: %d distinct texts across %d captions",
+                    len(by_text), len(self._captions),
+                )
+
+            # Lines translated in any earlier run come straight from disk
+            # googletrans keeps the plain "km" map it always used
+            backend = self.backend_for(self._source_language)
+            phrase_key = TARGET_LANGUAGE if backend == "googletrans" else f"{TARGET_LANGUAGE}-{backend}"
+            phrases = cache_utils.load_phrase_translations(phrase_key)
+            unique: List[str] = []
+            for text, caps in by_text.items():
+                cached = phrases.get(text)
+                if cached:
+                    self._report(caps, cached)
+                    done += len(caps)
                 else:
-                    # All retries exhausted – skip
-                    logger.error(
-                        "Caption %d skipped — all %d translation attempts failed. Last error: %s",
-                        cap.index, self.MAX_RETRIES, last_exc,
+                    unique.append(text)
+            if done:
+                logger.info("TranslateWorker: %d captions from the phrase cache", done)
+                self.progress.emit(int(done / total * 100))
+
+            if unique and backend != "googletrans":
+                self._nmt = self._load_nmt()
+                if self._nmt is None:
+                    phrase_key = None   # googletrans results must not land in the NLLB map
+            if self._nmt is not None:
+                # One model: batches run back to back, each as one forward pass
+                batch_size, workers = self.NMT_BATCH_SIZE, 1
+            else:
+                # Batches are independent requests, so several are kept in flight
+                batch_size, workers = self.BATCH_SIZE, self.MAX_WORKERS
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = {
+                    executor.submit(self._translate_batch, batch): batch
+                    for batch in (
+                        unique[start:start + batch_size]
+                        for start in range(0, len(unique), batch_size)
                     )
-                    self.caption_skipped.emit(cap.index)
-
-                pct = int((i + 1) / total * 100)
-                self.progress.emit(pct)
+                }
+                for future in as_completed(futures):
+                    if self._cancelled:
+                        logger.info("TranslateWorker: cancelled after %d captions", done)
+                        return
+                    batch = futures[future]
+                    for text, translated in zip(batch, future.result()):
+                        if translated:
+                            phrases[text] = translated
+                            learned += 1
+                        self._report(by_text[text], translated)
+                        done += len(by_text[text])
+
+                    self.progress.emit(int(done / total * 100))
+            finally:
+                # Drop queued batches on cancel/error; in-flight ones finish on their own
+                executor.shutdown(wait=False, cancel_futures=True)
 
             logger.info("TranslateWorker done")
             self.progress.emit(100)
@@ -104,4 +165,69 @@ class TranslateWorker(QObject):
             logger.debug(traceback.format_exc())
             self.error.emit(str(exc))
         finally:
+            # Keep what was translated even if the run was cut short
+            if learned and phrase_key:
+                cache_utils.save_phrase_translations(phrase_key, phrases)
             self.finished.emit()
+
+    # ------------------------------------------------------------------ private
+    def _report(self, caps: List[Caption], translated: str | None) -> None:
+        """Emit the outcome for every caption that shares one source text."""
+        for cap in caps:
+            if translated:
+                self.caption_translated.emit(cap.index, translated)
+            else:
+                # All retries exhausted – skip
+                logger.error(
+                    "Caption %d skipped — translation failed after %d attempts",
+                    cap.index, self.MAX_RETRIES,
+                )
+                self.caption_skipped.emit(cap.index)
+
+    def _load_nmt(self):
+        """Return the local NLLB model, or None to use googletrans."""
+        model_dir = nmt.model_dir_from_env()
+        if model_dir is None:
+            return None
+        # The local model was asked for, so every fallback is a warning
+        if not os.path.isdir(model_dir):
+            logger.warning("%s=%s is not a directory — using googletrans", nmt.MODEL_DIR_ENV, model_dir)
+            return None
+        if self._source_language not in nmt.NLLB_CODES:
+            logger.warning("No NLLB code for language %r — using googletrans", self._source_language)
+            return None
+        try:
+            # Shares the heavy-model slot with Whisper
+            return model_registry.get("nmt", model_dir, lambda: nmt.load_model(model_dir))
+        except ImportError as exc:
+            logger.warning(
+                "%s is set but the local translator is not installed (%s); "
+                "install the 'nmt' extra (ctranslate2, sentencepiece) — using googletrans",
+                nmt.MODEL_DIR_ENV, exc,
+            )
+        except Exception as exc:
+            logger.warning("Local NLLB model %s failed to load (%s) — using googletrans", model_dir, exc)
+        return None
+
+    def _translate_batch(self, texts: List[str]) -> List[str | None]:
+        """Translate one batch of texts, retrying the whole request on failure."""
+        for attempt in range(1, self.MAX_RETRIES + 1):
+            if self._cancelled:
+                break
+            try:
+                if self._nmt is not None:
+                    return nmt.translate_texts(
+                        self._nmt, texts,
+                        src=nmt.NLLB_CODES[self._source_language],
+                        tgt=nmt.NLLB_CODES[TARGET_LANGUAGE],
+                        max_batch_size=self.NMT_BATCH_SIZE,
+                    )
+                return translate_texts(texts, target_language=TARGET_LANGUAGE)
+            except Exception as exc:
+                logger.warning(
+                    "Translation attempt %d/%d failed for a batch of %d texts: %s",
+                    attempt, self.MAX_RETRIES, len(texts), exc,
+                )
+                if attempt < self.MAX_RETRIES:
+                    time.sleep(self.RETRY_DELAY)
+        return [None] * len(texts)
@@ -4,16 +4,31 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import shutil
+import subprocess
+import tempfile
+import threading
 import time
 import traceback
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal
 
 from app.models.caption import Caption
+from app.utils import cache_utils
 
 logger = logging.getLogger(__name__)
 
+# Imported with the module (MainWindow warms worker modules up on idle), not
+# on the first click; a missing package is reported when a run starts
+try:
+    import edge_tts
+except ImportError as _exc:
+    logger.warning("edge-tts unavailable: %s", _exc)
+    edge_tts = None
+
 # Edge TTS Khmer voices
 KHMER_VOICES = {
     "Female – Sreymom": "km-KH-SreymomNeural",
@@ -21,10 +36,124 @@ KHMER_VOICES = {
 }
 DEFAULT_VOICE = "km-KH-SreymomNeural"
 
+# Adjacent short captions sharing a voice are synthesised in one request
+MAX_GROUP_CAPTIONS = 8
+MAX_GROUP_CHARS    = 400
+
+# Edge TTS boundary offsets are in 100-ns ticks
+_TICKS_PER_SECOND = 10_000_000
+# Audio kept around each caption's words when cutting a grouped clip (s)
+_CUT_LEAD = 0.05
+_CUT_TAIL = 0.15
+
+
+class _TokenBucket:
+    """Adaptive, thread-safe request rate limiter for Edge TTS.
+
+    Requests take a token; tokens refill at ``rate`` per second up to
+    ``burst``.  A throttling response halves the rate, and every
+    ``RAMP_AFTER`` consecutive successes raise it by 20 % (up to ``max_rate``).
+    """
+
+    RAMP_AFTER = 5
+
+    def __init__(
+        self, rate: float = 6.0, burst: float = 6.0,
+        min_rate: float = 0.5, max_rate: float = 10.0,
+    ):
+        self._rate      = rate
+        self._burst     = burst
+        self._min_rate  = min_rate
+        self._max_rate  = max_rate
+        self._tokens    = burst
+        self._last      = time.monotonic()
+        self._successes = 0
+        self._lock      = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            # Reserve the token now (possibly going negative) and wait outside the lock
+            self._tokens -= 1.0
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.RAMP_AFTER:
+                self._successes = 0
+                self._rate = min(self._rate * 1.2, self._max_rate)
+
+    def on_failure(self, exc: Exception) -> None:
+        if not _is_throttled(exc):
+            return
+        with self._lock:
+            self._successes = 0
+            self._rate = max(self._rate * 0.5, self._min_rate)
+            logger.info("Edge TTS throttled — request rate lowered to %.2f/s", self._rate)
+
+
+def _is_throttled(exc: Exception) -> bool:
+    """True if *exc* looks like an HTTP 429 / 503 rate-limit response."""
+    status = getattr(exc, "status", None)
+    return status in (429, 503) or "429" in str(exc) or "503" in str(exc)
+
+
+def group_adjacent_captions(
+    captions: List[Caption],
+    default_voice: str = DEFAULT_VOICE,
+    max_captions: int = MAX_GROUP_CAPTIONS,
+    max_chars: int = MAX_GROUP_CHARS,
+) -> List[List[Caption]]:
+    """Group consecutive captions with the same voice into TTS requests.
+
+    Captions without Khmer text are left out.  A group never spans a gap in
+    caption indices and is capped at *max_captions* / *max_chars*.
+    """
+    groups: List[List[Caption]] = []
+    group: List[Caption] = []
+    group_voice = ""
+    group_chars = 0
+    for cap in captions:
+        if not cap.khmer_text:
+            if group:
+                groups.append(group)
+                group = []
+            continue
+        voice = cap.voice or default_voice
+        chars = len(cap.khmer_text)
+        if group and (
+            voice != group_voice
+            or cap.index != group[-1].index + 1
+            or len(group) >= max_captions
+            or group_chars + chars > max_chars
+        ):
+            groups.append(group)
+            group = []
+        if not group:
+            group_voice, group_chars = voice, 0
+        group.append(cap)
+        group_chars += chars
+    if group:
+        groups.append(group)
+    return groups
+
 
 class TTSWorker(QObject):
     """Generate a TTS audio file per caption using edge-tts.
 
+    Adjacent captions with the same voice are sent as one request (see
+    ``group_adjacent_captions``) and the result is cut back into one file
+    per caption using the word-boundary timings Edge TTS returns.  Up to
+    ``MAX_WORKERS`` requests run concurrently; results are reported in
+    completion order.  Audio already generated for the same text and voice
+    is restored from the on-disk cache without a request.
+
     Signals
     -------
     progress(int):                  0–100 percent.
@@ -33,6 +162,11 @@ class TTSWorker(QObject):
     finished():                     always emitted at the end.
     """
 
+    MAX_WORKERS = 8   # concurrent Edge TTS requests
+    MAX_RETRIES = 5
+    # How often a pool thread waiting on the event loop checks for shutdown (seconds)
+    LOOP_POLL_INTERVAL = 0.5
+
     progress            = Signal(int)
     caption_audio_ready = Signal(int, str)   # (caption index, file path)
     error               = Signal(str)
@@ -43,12 +177,19 @@ class TTSWorker(QObject):
         captions: List[Caption],
         output_dir: str,
         voice: str = DEFAULT_VOICE,
+        groups: Optional[List[List[Caption]]] = None,
     ):
         super().__init__()
         self._captions   = captions
         self._output_dir = output_dir
+        self._out_prefix = os.path.join(output_dir, "tts_")   # joined once, not per caption
         self._voice      = voice
+        self._groups     = groups      # None → grouped in run()
         self._cancelled  = False
+        self._bucket     = _TokenBucket()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock     = threading.Lock()   # guards _loop / _loop_stopping
+        self._loop_stopping = False
 
     def cancel(self) -> None:
         """Request cancellation. The worker will stop at the next safe checkpoint."""
@@ -59,51 +200,58 @@ class TTSWorker(QObject):
     def run(self) -> None:
         logger.info("TTSWorker starting — %d captions, voice=%s", len(self._captions), self._voice)
         try:
-            import edge_tts
+            if edge_tts is None:
+                raise RuntimeError("edge-tts is not installed")
 
             os.makedirs(self._output_dir, exist_ok=True)
             total = len(self._captions) or 1
+            loop_thread = self._start_loop()
 
-            for i, cap in enumerate(self._captions):
-                if self._cancelled:
-                    logger.info("TTSWorker: cancelled at caption %d", i)
-                    return
-                if not cap.khmer_text:
-                    self.progress.emit(int((i + 1) / total * 100))
-                    continue
+            groups = self._groups
+            if groups is None:
+                groups = group_adjacent_captions(self._captions, self._voice)
+            groups = self._take_cached(groups)
+            groups, copies = self._split_duplicates(groups)
+            jobs = sum(len(g) for g in groups) + sum(len(c) for c in copies.values())
+            done = len(self._captions) - jobs   # cached / text-less captions need no request
+            logger.info("TTSWorker: %d captions in %d requests", jobs, len(groups))
+            pct_per_caption = 100.0 / total
+            self.progress.emit(int(done * pct_per_caption))
 
-                out_path = os.path.join(self._output_dir, f"tts_{cap.index:04d}.mp3")
-
-                # Use per-caption voice if set, otherwise fall back to worker default
-                voice = cap.voice if cap.voice else self._voice
-
-                # Retry with exponential backoff to handle Edge TTS 503 rate-limiting
-                max_retries = 5
-                for attempt in range(max_retries):
-                    try:
-                        communicate = edge_tts.Communicate(
-                            text=cap.khmer_text,
-                            voice=voice,
-                        )
-                        asyncio.run(communicate.save(out_path))
-                        break  # success
-                    except Exception as exc:
-                        logger.warning(
-                            "TTS attempt %d/%d failed for caption %d: %s",
-                            attempt + 1, max_retries, cap.index, exc,
-                        )
-                        if attempt == max_retries - 1:
-                            raise
-                        wait = 2 ** attempt  # 1s, 2s, 4s, 8s …
-                        time.sleep(wait)
-
-                logger.debug("TTS caption %d → %s", cap.index, out_path)
-                self.caption_audio_ready.emit(cap.index, out_path)
-                self.progress.emit(int((i + 1) / total * 100))
-
-                # Small delay between requests to avoid triggering rate limits
-                if i < len(self._captions) - 1:
-                    time.sleep(0.5)
+            executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+            try:
+                futures = [
+                    executor.submit(self._synthesize_group, edge_tts, group)
+                    for group in groups
+                ]
+                last_pct = -1
+                for future in as_completed(futures):
+                    if self._cancelled:
+                        logger.info("TTSWorker: cancelled after %d captions", done)
+                        return
+                    # re-raises the last synthesis error
+                    for cap, out_path in future.result():
+                        if out_path is None:
+                            continue
+                        logger.debug("TTS caption %d → %s", cap.index, out_path)
+                        cache_utils.save_tts_audio(self._cache_key(cap), out_path)
+                        self.caption_audio_ready.emit(cap.index, out_path)
+                        done += 1
+                        for dup in copies.get(cap.index, ()):
+                            dup_path = self._out_path(dup)
+                            shutil.copyfile(out_path, dup_path)
+                            self.caption_audio_ready.emit(dup.index, dup_path)
+                            done += 1
+                    # Only signal the UI thread when the percentage moves
+                    pct = int(done * pct_per_caption)
+                    if pct != last_pct:
+                        self.progress.emit(pct)
+                        last_pct = pct
+            finally:
+                # Drop queued captions on cancel/error; in-flight ones are
+                # cancelled with the event loop
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._stop_loop(loop_thread)
 
             logger.info("TTSWorker done")
             self.progress.emit(100)
@@ -114,3 +262,265 @@ class TTSWorker(QObject):
             self.error.emit(str(exc))
         finally:
             self.finished.emit()
+
+    # ------------------------------------------------------------------ private
+    def _start_loop(self) -> threading.Thread:
+        """Start the event loop every request of this run is executed on.
+
+        One long-lived loop replaces an ``asyncio.run`` (loop set-up and
+        teardown) per request; pool threads hand it coroutines via
+        :meth:`_run_async`.
+        """
+        with self._loop_lock:
+            self._loop = asyncio.new_event_loop()
+            self._loop_stopping = False
+        thread = threading.Thread(target=self._loop.run_forever, name="tts-loop", daemon=True)
+        thread.start()
+        return thread
+
+    def _stop_loop(self, thread: threading.Thread) -> None:
+        # From here on _run_async() refuses new coroutines, and pool threads
+        # already waiting give up instead of blocking on a stopped loop
+        with self._loop_lock:
+            self._loop_stopping = True
+            loop = self._loop
+        if loop is None:
+            return
+
+        async def _cancel_pending() -> None:
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result(timeout=5)
+        except Exception as exc:
+            logger.debug("TTS loop shutdown: %s", exc)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        with self._loop_lock:
+            if not loop.is_running():
+                loop.close()
+            self._loop = None
+
+    def _run_async(self, coro):
+        """Run *coro* on the worker's event loop and wait for its result.
+
+        Raises RuntimeError once the loop is being stopped, both for new
+        coroutines and for ones still waiting, so no pool thread can block
+        on a loop that will never run its task.
+        """
+        with self._loop_lock:
+            loop = self._loop
+            if self._loop_stopping or loop is None or loop.is_closed():
+                coro.close()
+                raise RuntimeError("TTS event loop is not running")
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+        while True:
+            try:
+                return future.result(timeout=self.LOOP_POLL_INTERVAL)
+            except FutureTimeout:
+                if self._loop_stopping:
+                    future.cancel()
+                    raise RuntimeError("TTS event loop stopped") from None
+
+    def _cache_key(self, cap: Caption) -> str:
+        return cache_utils.tts_key(cap.khmer_text, cap.voice or self._voice)
+
+    def _out_path(self, cap: Caption) -> str:
+        return f"{self._out_prefix}{cap.index:04d}.mp3"
+
+    def _split_duplicates(
+        self, groups: List[List[Caption]],
+    ) -> Tuple[List[List[Caption]], Dict[int, List[Caption]]]:
+        """Keep the first caption of each distinct (text, voice) in *groups*.
+
+        Returns the trimmed groups and a map from each kept caption's index
+        to the later captions that reuse its audio file.
+        """
+        first: Dict[Tuple[str, str], Caption] = {}
+        copies: Dict[int, List[Caption]] = {}
+        remaining: List[List[Caption]] = []
+        for group in groups:
+            rest: List[Caption] = []
+            for cap in group:
+                key = (cap.khmer_text, cap.voice or self._voice)
+                owner = first.setdefault(key, cap)
+                if owner is cap:
+                    rest.append(cap)
+                else:
+                    copies.setdefault(owner.index, []).append(cap)
+            if rest:
+                remaining.append(rest)
+        if copies:
+            logger.info(
+                "TTSWorker: %d repeated captions reuse another caption's audio",
+                sum(len(c) for c in copies.values()),
+            )
+        return remaining, copies
+
+    def _take_cached(self, groups: List[List[Caption]]) -> List[List[Caption]]:
+        """Restore cached audio and return *groups* minus the captions it covered."""
+        remaining: List[List[Caption]] = []
+        hits = 0
+        for group in groups:
+            rest: List[Caption] = []
+            for cap in group:
+                out_path = self._out_path(cap)
+                if cache_utils.load_tts_audio(self._cache_key(cap), out_path):
+                    self.caption_audio_ready.emit(cap.index, out_path)
+                    hits += 1
+                else:
+                    rest.append(cap)
+            if rest:
+                remaining.append(rest)
+        if hits:
+            logger.info("TTSWorker: %d captions restored from the audio cache", hits)
+        return remaining
+
+    def _synthesize_group(
+        self, edge_tts, group: List[Caption],
+    ) -> List[Tuple[Caption, Optional[str]]]:
+        """Synthesise a group of captions; falls back to one request each."""
+        if len(group) > 1 and not self._cancelled:
+            try:
+                paths = self._synthesize_merged(edge_tts, group)
+                if paths is not None:
+                    return list(zip(group, paths))
+            except Exception as exc:
+                logger.warning(
+                    "Grouped TTS failed for captions %d–%d, retrying one by one: %s",
+                    group[0].index, group[-1].index, exc,
+                )
+        return [(cap, self._synthesize(edge_tts, cap)) for cap in group]
+
+    def _synthesize_merged(self, edge_tts, group: List[Caption]) -> Optional[List[str]]:
+        """One Edge TTS request for *group*, cut back into per-caption files.
+
+        Returns None when the word boundaries cannot be mapped onto every
+        caption (the caller then synthesises them individually).
+        """
+        voice = group[0].voice or self._voice
+
+        # Character span of each caption inside the joined request text
+        spans: List[Tuple[int, int]] = []
+        parts: List[str] = []
+        pos = 0
+        for cap in group:
+            spans.append((pos, pos + len(cap.khmer_text)))
+            parts.append(cap.khmer_text)
+            pos += len(cap.khmer_text) + 1
+        text = "\n".join(parts)
+
+        fd, merged_path = tempfile.mkstemp(suffix=".mp3", dir=self._output_dir)
+        os.close(fd)
+        try:
+            self._bucket.acquire()
+            try:
+                boundaries = self._run_async(
+                    self._stream_to_file(edge_tts, text, voice, merged_path)
+                )
+            except Exception as exc:
+                self._bucket.on_failure(exc)
+                raise
+            self._bucket.on_success()
+
+            # Map each word onto the caption whose characters it covers
+            first: List[Optional[float]] = [None] * len(group)
+            last: List[float] = [0.0] * len(group)
+            cursor = 0
+            for offset, duration, word in boundaries:
+                found = text.find(word, cursor) if word else -1
+                if found < 0:
+                    continue
+                cursor = found + len(word)
+                for i, (lo, hi) in enumerate(spans):
+                    if lo <= found < hi:
+                        if first[i] is None:
+                            first[i] = offset
+                        last[i] = offset + duration
+                        break
+            if any(f is None for f in first):
+                logger.debug(
+                    "TTS group %d–%d: word boundaries did not cover every caption",
+                    group[0].index, group[-1].index,
+                )
+                return None
+
+            out_paths = [self._out_path(cap) for cap in group]
+            # One ffmpeg run with an output per caption (mp3 stream copy)
+            cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", merged_path]
+            for i, out_path in enumerate(out_paths):
+                start = max(0.0, first[i] - _CUT_LEAD)
+                end = last[i] + _CUT_TAIL
+                if i + 1 < len(group):
+                    end = min(end, first[i + 1])
+                cmd += ["-ss", f"{start:.3f}", "-to", f"{end:.3f}", "-c", "copy", out_path]
+            result = subprocess.run(cmd, capture_output=True, timeout=60)
+            if result.returncode != 0:
+                raise RuntimeError(
+                    result.stderr.decode("utf-8", errors="ignore")[-400:]
+                    or f"ffmpeg exited with code {result.returncode}"
+                )
+            return out_paths
+        finally:
+            try:
+                os.remove(merged_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    async def _stream_to_file(
+        edge_tts, text: str, voice: str, out_path: str,
+    ) -> List[Tuple[float, float, str]]:
+        """Save the audio for *text* and return its (start s, duration s, word) boundaries."""
+        communicate = edge_tts.Communicate(text=text, voice=voice, boundary="WordBoundary")
+        boundaries: List[Tuple[float, float, str]] = []
+        with open(out_path, "wb") as fh:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    fh.write(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    boundaries.append((
+                        chunk["offset"] / _TICKS_PER_SECOND,
+                        chunk["duration"] / _TICKS_PER_SECOND,
+                        chunk["text"],
+                    ))
+        return boundaries
+
+    def _synthesize(self, edge_tts, cap: Caption) -> str | None:
+        """Synthesise one caption on a pool thread; returns the audio path.
+
+        Returns None if the worker was cancelled before the request started.
+        """
+        if self._cancelled:
+            return None
+
+        out_path = self._out_path(cap)
+
+        # Use per-caption voice if set, otherwise fall back to worker default
+        voice = cap.voice if cap.voice else self._voice
+
+        # Retry with exponential backoff to handle Edge TTS 503 rate-limiting
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                communicate = edge_tts.Communicate(
+                    text=cap.khmer_text,
+                    voice=voice,
+                )
+                self._bucket.acquire()
+                self._run_async(communicate.save(out_path))
+                self._bucket.on_success()
+                return out_path
+            except Exception as exc:
+                self._bucket.on_failure(exc)
+                logger.warning(
+                    "TTS attempt %d/%d failed for caption %d: %s",
+                    attempt + 1, self.MAX_RETRIES, cap.index, exc,
+                )
+                if attempt == self.MAX_RETRIES - 1 or self._cancelled or self._loop_stopping:
+                    raise
+                wait = 2 ** attempt  # 1s, 2s, 4s, 8s …
+                time.sleep(wait)
+        return None
@@ -1,28 +1,95 @@
+import threading
+from collections import OrderedDict
+
 from googletrans import Translator
 
+# One translator per thread, so its HTTP connection pool and token are
+# reused instead of rebuilt for every request; a Translator (and its httpx
+# client) is not safe to share between the translate pool's threads
+_LOCAL = threading.local()
+
+def _translator():
+    translator = getattr(_LOCAL, "translator", None)
+    if translator is None:
+        translator = _LOCAL.translator = Translator()
+    return translator
+
+# (text, target_language) → translation, least recently used first.  Only
+# successful translations are stored, so failures are retried next time.
+_MEMO = OrderedDict()
+_MEMO_MAX = 4096
+_MEMO_LOCK = threading.Lock()
+
+def _memo_get(text, target_language):
+    with _MEMO_LOCK:
+        result = _MEMO.get((text, target_language))
+        if result is not None:
+            _MEMO.move_to_end((text, target_language))
+        return result
+
+def _memo_put(text, target_language, result):
+    if not result:
+        return
+    with _MEMO_LOCK:
+        _MEMO[(text, target_language)] = result
+        _MEMO.move_to_end((text, target_language))
+        if len(_MEMO) > _MEMO_MAX:
+            _MEMO.popitem(last=False)
+
 def translate_text(text, target_language='en'):
-    # Initialize the Translator
-    translator = Translator()
-    
+    cached = _memo_get(text, target_language)
+    if cached is not None:
+        return cached
     try:
         # Perform the translation
         # dest is the target language code (e.g., 'en' for English, 'es' for Spanish, 'fr' for French)
-        result = translator.translate(text, dest=target_language)
-        
-        # Print the results
-        print(f"Original Text: {text}")
-        print(f"Detected Source Language: {result.src}")
-        print(f"Translated Text ({result.dest}): {result.text}")
-        
-        return result.text
+        result = _translator().translate(text, dest=target_language).text
+        _memo_put(text, target_language, result)
+        return result
         
     except Exception as e:
         print(f"An error occurred: {e}")
         return None
 
+def translate_texts(texts, target_language='en'):
+    """Translate a list of texts, sending the single-line ones in one request.
+
+    The batchable texts are joined with newlines and translated together;
+    Google keeps line breaks, so the response is split back per item.  Texts
+    that contain a newline themselves (or are empty), and every item of a
+    response whose line count does not match, go through translate_text().
+
+    Texts translated before (by either function) are answered from an
+    in-memory LRU memo without a request.
+
+    Returns a list aligned with *texts*; an entry is None when that item
+    could not be translated.  Errors on the batched request are raised so
+    the caller can retry the whole batch.
+    """
+    results = [_memo_get(t, target_language) for t in texts]
+    pending = [i for i, r in enumerate(results) if r is None]
+    batch_pos = [i for i in pending if texts[i] and "\n" not in texts[i]]
+    single_pos = [i for i in pending if not (texts[i] and "\n" not in texts[i])]
+
+    if batch_pos:
+        joined = "\n".join(texts[i] for i in batch_pos)
+        lines = _translator().translate(joined, dest=target_language).text.split("\n")
+        if len(lines) == len(batch_pos):
+            for i, line in zip(batch_pos, lines):
+                results[i] = line.strip() or None
+                _memo_put(texts[i], target_language, results[i])
+        else:
+            # Google merged or split lines — fall back to one request per item
+            single_pos.extend(batch_pos)
+
+    for i in single_pos:
+        results[i] = translate_text(texts[i], target_language=target_language)
+
+    return results
+
 # --- Example Usage ---
 if __name__ == "__main__":
     
     # English text to translate to Khmer ('km')
     english_text = "Writing code is a lot of fun!"
-    translate_text(english_text, target_language='km')  # Khmer language code is 'km'
\ No newline at end of file
+    print(translate_text(english_text, target_language='km'))  # Khmer language code is 'km'
\ No newline at end of file
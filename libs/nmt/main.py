@@ -0,0 +1,105 @@
+import argparse
+import os
+import threading
+
+# Environment variable pointing at a CTranslate2-converted NLLB-200 model
+# directory (it must also contain the "sentencepiece.bpe.model" tokenizer),
+# e.g. one produced by
+#   ct2-transformers-converter --model facebook/nllb-200-distilled-600M \
+#       --quantization int8 --output_dir nllb-200-distilled-600M-int8 \
+#       --copy_files sentencepiece.bpe.model
+MODEL_DIR_ENV = "KHMER_DUBBER_NMT_MODEL"
+
+# Whisper / ISO 639-1 language code → NLLB-200 language code
+NLLB_CODES = {
+    "zh": "zho_Hans",
+    "en": "eng_Latn",
+    "ko": "kor_Hang",
+    "ja": "jpn_Jpan",
+    "vi": "vie_Latn",
+    "th": "tha_Thai",
+    "hi": "hin_Deva",
+    "km": "khm_Khmr",
+}
+
+
+def model_dir_from_env():
+    """Return the configured NLLB model directory, or None when unset."""
+    return os.environ.get(MODEL_DIR_ENV, "").strip() or None
+
+
+def load_model(model_dir: str, device: str = "auto", compute_type: str = "auto"):
+    """
+    Load a CTranslate2 NLLB model and its SentencePiece tokenizer.
+
+    device:
+        "auto" (default) → "cuda" when CTranslate2 sees a GPU, else "cpu".
+
+    compute_type:
+        "auto" (default) → int8_float16 on CUDA, int8 on CPU; INT8 weights
+        are several times faster than FP16/FP32 at near-identical quality.
+
+    Returns:
+        (translator, tokenizer, lock) — pass it to translate_texts().
+    """
+    import ctranslate2
+    import sentencepiece
+
+    if device == "auto":
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if compute_type == "auto":
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+
+    print(f"📦 Loading NLLB model: '{model_dir}' ({device}, {compute_type})…")
+    translator = ctranslate2.Translator(model_dir, device=device, compute_type=compute_type)
+    tokenizer = sentencepiece.SentencePieceProcessor(
+        model_file=os.path.join(model_dir, "sentencepiece.bpe.model")
+    )
+    # SentencePieceProcessor is not documented as thread-safe
+    return translator, tokenizer, threading.Lock()
+
+
+def translate_texts(model, texts, src="zho_Hans", tgt="khm_Khmr", max_batch_size=64):
+    """Translate a list of texts in batched forward passes.
+
+    *src* and *tgt* are NLLB codes (see NLLB_CODES).  Returns a list aligned
+    with *texts*; an entry is None when that item is empty or came back
+    empty.
+    """
+    translator, tokenizer, lock = model
+    results = [None] * len(texts)
+    positions = [i for i, text in enumerate(texts) if text and text.strip()]
+    if not positions:
+        return results
+
+    with lock:
+        pieces = tokenizer.encode([texts[i] for i in positions], out_type=str)
+    source = [[src, *tokens, "</s>"] for tokens in pieces]
+    outputs = translator.translate_batch(
+        source,
+        target_prefix=[[tgt]] * len(source),
+        max_batch_size=max_batch_size,
+        beam_size=2,
+    )
+    # Each hypothesis starts with the target language token
+    hypotheses = [out.hypotheses[0][1:] for out in outputs]
+    with lock:
+        decoded = tokenizer.decode(hypotheses)
+    for i, text in zip(positions, decoded):
+        results[i] = text.strip() or None
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Translate text with a local NLLB model")
+    parser.add_argument("text", help="Text to translate")
+    parser.add_argument("--model", default=model_dir_from_env(), help=f"Model directory (default: ${MODEL_DIR_ENV})")
+    parser.add_argument("--src", default="zho_Hans", help="NLLB source language code (default: zho_Hans)")
+    parser.add_argument("--tgt", default="khm_Khmr", help="NLLB target language code (default: khm_Khmr)")
+    args = parser.parse_args()
+
+    if not args.model:
+        print(f"❌ Error: no model directory given (use --model or set {MODEL_DIR_ENV}).")
+        exit(1)
+
+    print(translate_texts(load_model(args.model), [args.text], src=args.src, tgt=args.tgt)[0])